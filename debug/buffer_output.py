@@ -0,0 +1,58 @@
+"""
+Stdout buffering shared by the debug test scripts.
+
+A test's progress output is collected and written in one call when the test
+returns, instead of one write per print(). Error lines (containing ❌) are
+not held back: they are written immediately, along with anything buffered
+before them, so failures show up as they happen.
+"""
+
+import contextlib
+import functools
+import io
+import sys
+
+ERROR_MARKER = "❌"
+
+
+class _ErrorStreamingBuffer(io.StringIO):
+    """StringIO that passes error lines straight through to the real stream"""
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+        self._streaming = False
+
+    def write(self, s):
+        if not self._streaming and ERROR_MARKER in s:
+            self.drain()
+            self._streaming = True
+        if not self._streaming:
+            return super().write(s)
+
+        self._stream.write(s)
+        # Keep passing through until the error line has been terminated
+        if s.rfind("\n") > s.rfind(ERROR_MARKER):
+            self._streaming = False
+            self._stream.flush()
+        return len(s)
+
+    def drain(self):
+        """Write out everything buffered so far"""
+        self._stream.write(self.getvalue())
+        self.seek(0)
+        self.truncate()
+
+
+def buffer_stdout(func):
+    """Collect everything func prints and write it to stdout in one call"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        out = _ErrorStreamingBuffer(sys.stdout)
+        try:
+            with contextlib.redirect_stdout(out):
+                return func(*args, **kwargs)
+        finally:
+            # Also runs on failure/exception, so error output is never lost
+            out.drain()
+    return wrapper
@@ -4,84 +4,207 @@ Inspect .kra file structure to find where reference images are stored.
 
 Usage:
     python3 debug/inspect-kra-references.py path/to/file.kra
+    python3 debug/inspect-kra-references.py --fast path/to/file.kra
+
+    --fast  Skip the archive listing (step 1) and go straight to maindoc.xml
 
 Requirements:
     - Python 3.6+
-    - No external dependencies (uses stdlib only)
+    - Optional: lxml (faster parsing of large maindoc.xml; falls back to stdlib)
 
 This script will:
 1. Extract .kra file (ZIP archive)
 2. List all files in archive
-3. Parse maindoc.xml and pretty-print structure
+3. Stream-parse maindoc.xml and summarize its structure
 4. Search for reference-image related nodes
 5. Show where reference image files are stored
 """
 
+import argparse
+import io
+import itertools
 import sys
 import zipfile
-import xml.etree.ElementTree as ET
 from pathlib import Path
-import re
 
-def pretty_print_xml(element, indent=0):
-    """Recursively print XML tree structure"""
-    tag = element.tag
-    attrs = " ".join(f'{k}="{v}"' for k, v in element.attrib.items())
-    text = (element.text or "").strip()
-    
-    prefix = "  " * indent
-    
-    if attrs:
-        print(f"{prefix}<{tag} {attrs}>", end="")
-    else:
-        print(f"{prefix}<{tag}>", end="")
-    
-    if text:
-        print(f" {text[:50]}..." if len(text) > 50 else f" {text}", end="")
-    
-    if len(element) > 0:
-        print()  # New line for children
-        for child in element:
-            pretty_print_xml(child, indent + 1)
-        print(f"{prefix}</{tag}>")
-    else:
-        print(f"</{tag}>")
+# Prefer lxml's C parser for large documents, fall back to stdlib
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+
+# Image file extensions (lowercase), matched with str.endswith
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.bmp')
+
+# Read buffer for streaming maindoc.xml out of the archive
+MAINDOC_BUFFER_SIZE = 1 << 16
 
-def search_xml_for_references(element, path="", results=None):
-    """Recursively search XML for reference-image related nodes"""
-    if results is None:
-        results = []
+def open_maindoc(kra):
+    """Open maindoc.xml as a buffered stream instead of reading it into memory"""
+    return io.BufferedReader(kra.open('maindoc.xml'), buffer_size=MAINDOC_BUFFER_SIZE)
+
+# Number of maindoc.xml lines shown in the step 6 dump
+XML_DUMP_LINES = 100
+
+def iter_capped_lines(text_stream, limit):
+    """
+    Yield (line_number, line) for the first `limit` lines of a text stream,
+    plus one extra line if the stream continues, then stop reading so the
+    rest of the document is never decoded.
+    """
+    for i, line in enumerate(itertools.islice(text_stream, limit + 1), 1):
+        yield i, line.rstrip('\n')
+
+def iterparse_xml(stream):
+    """Stream (event, element) pairs from an XML file-like object"""
+    events = ('start', 'end')
+    if HAS_LXML:
+        return ET.iterparse(stream, events=events, huge_tree=True, recover=True,
+                            remove_comments=True, remove_pis=True)
+    return ET.iterparse(stream, events=events)
+
+# Common reference image locations checked in step 5: (xpath label, tag, attribute filter)
+COMMON_PATHS = [
+    ('.//REFERENCEIMAGES', 'REFERENCEIMAGES', None),
+    ('.//referenceimages', 'referenceimages', None),
+    ('.//ReferenceImages', 'ReferenceImages', None),
+    ('.//reference-images', 'reference-images', None),
+    ('.//REFERENCEIMAGE', 'REFERENCEIMAGE', None),
+    ('.//referenceimage', 'referenceimage', None),
+    ('.//ASSISTANT', 'ASSISTANT', None),
+    ('.//assistant', 'assistant', None),
+    ('.//IMAGE[@type="reference"]', 'IMAGE', ('type', 'reference')),
+    ('.//image[@type="reference"]', 'image', ('type', 'reference')),
+]
+
+# Tags worth indexing during the scan pass (keeps the index small)
+COMMON_PATH_TAGS = frozenset(tag for _, tag, _ in COMMON_PATHS)
+
+# Substring that marks reference-related tags ('ref' also covers 'reference')
+REF_TAG_SUBSTRING = 'ref'
+# Substring that marks reference-related attribute names/values
+REF_ATTR_SUBSTRING = 'reference'
+
+def search_element_for_references(element, tags, results):
+    """Check a single element for reference-image related tags/attributes
     
-    current_path = f"{path}/{element.tag}"
+    `tags` is the list of open element tags; the document path is only
+    joined from it when a hit is recorded.
+    
+    Returns the tag-match result dict (so its text can be filled in once the
+    element has been fully parsed), or None.
+    """
+    tag = element.tag
+    attr_items = element.attrib.items()
+    tag_match = None
+    path = None
     
     # Check if this node relates to references
-    tag_lower = element.tag.lower()
-    if 'reference' in tag_lower or 'ref' in tag_lower:
-        results.append({
-            'path': current_path,
-            'tag': element.tag,
-            'attrs': dict(element.attrib),
-            'text': (element.text or "").strip()
-        })
+    if REF_TAG_SUBSTRING in tag.lower():
+        path = "/" + "/".join(tags)
+        tag_match = {
+            'path': path,
+            'tag': tag,
+            'attrs': dict(attr_items),
+            'text': ""
+        }
+        results.append(tag_match)
     
     # Check attributes for reference-related values
-    for attr_name, attr_value in element.attrib.items():
-        if 'reference' in attr_name.lower() or 'reference' in attr_value.lower():
+    for attr_name, attr_value in attr_items:
+        if REF_ATTR_SUBSTRING in attr_name.lower() or REF_ATTR_SUBSTRING in attr_value.lower():
+            if path is None:
+                path = "/" + "/".join(tags)
             results.append({
-                'path': current_path,
-                'tag': element.tag,
+                'path': path,
+                'tag': tag,
                 'attr': f"{attr_name}={attr_value}",
                 'context': 'attribute'
             })
     
-    # Recurse into children
-    for child in element:
-        search_xml_for_references(child, current_path, results)
+    return tag_match
+
+def scan_maindoc(stream):
+    """
+    Single streaming pass over maindoc.xml.
+    
+    Collects everything steps 2-5 need (root info, reference-related nodes,
+    first two structure levels, common path hits) and clears each element
+    once it has been processed, so memory stays bounded on large documents.
+    """
+    scan = {
+        'root_tag': None,
+        'root_attrs': {},
+        'references': [],
+        'structure': [],  # [(tag, child_count, [(tag, attrs, child_count), ...]), ...]
+        'common_paths': {},
+    }
+    
+    # tag -> [attrs snapshot, ...] for tags referenced by COMMON_PATHS
+    tag_index = {}
     
-    return results
+    tags = []          # tags of currently open elements (document path)
+    child_counts = []  # child counts of currently open elements
+    tag_matches = []   # reference tag-match dicts of open elements (or None)
+    level2 = []        # level-2 children of the currently open level-1 element
+    
+    for event, elem in iterparse_xml(stream):
+        if event == 'start':
+            if child_counts:
+                child_counts[-1] += 1
+            else:
+                scan['root_tag'] = elem.tag
+                scan['root_attrs'] = dict(elem.attrib)
+            tags.append(elem.tag)
+            child_counts.append(0)
+            tag_matches.append(search_element_for_references(elem, tags, scan['references']))
+            continue
+        
+        # 'end': element (including its text) is complete
+        depth = len(tags)
+        n_children = child_counts.pop()
+        tags.pop()
+        
+        tag_match = tag_matches.pop()
+        if tag_match is not None:
+            tag_match['text'] = (elem.text or "").strip()
+        
+        if elem.tag in COMMON_PATH_TAGS:
+            tag_index.setdefault(elem.tag, []).append(dict(elem.attrib))
+        
+        if depth == 3:
+            level2.append((elem.tag, list(elem.attrib.items())[:2], n_children))
+        elif depth == 2:
+            scan['structure'].append((elem.tag, n_children, level2))
+            level2 = []
+        
+        # Free processed subtree
+        elem.clear()
+        if HAS_LXML:
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    
+    # Answer every common-path lookup from the index (no further tree walks)
+    for xpath, tag, attr_filter in COMMON_PATHS:
+        nodes = tag_index.get(tag, [])
+        if attr_filter is not None:
+            attr_name, attr_value = attr_filter
+            nodes = [attrs for attrs in nodes if attrs.get(attr_name) == attr_value]
+        scan['common_paths'][xpath] = [(tag, attrs) for attrs in nodes]
+    
+    return scan
 
-def inspect_kra_file(kra_path):
-    """Main inspection function"""
+def inspect_kra_file(kra_path, fast=False):
+    """
+    Main inspection function
+    
+    Args:
+        kra_path: Path to the .kra file
+        fast: Skip listing/categorizing archive entries and only inspect maindoc.xml
+    """
     print("=" * 70)
     print(f"INSPECTING: {kra_path}")
     print("=" * 70)
@@ -95,58 +218,77 @@ def inspect_kra_file(kra_path):
     
     try:
         with zipfile.ZipFile(kra_path, 'r') as kra:
-            # Step 1: List all files
-            print("\n" + "-" * 70)
-            print("STEP 1: Files in .kra archive")
-            print("-" * 70)
+            if fast:
+                print("\n⚡ Fast mode: skipping archive listing (step 1)")
+            else:
+                # Step 1: List all files
+                print("\n" + "-" * 70)
+                print("STEP 1: Files in .kra archive")
+                print("-" * 70)
             
-            file_list = kra.namelist()
-            print(f"Total files: {len(file_list)}\n")
+                infos = kra.infolist()
+                print(f"Total files: {len(infos)}\n")
             
-            # Categorize files
-            xml_files = [f for f in file_list if f.endswith('.xml')]
-            image_files = [f for f in file_list if re.search(r'\.(png|jpg|jpeg|gif|svg|bmp)$', f, re.I)]
-            other_files = [f for f in file_list if f not in xml_files and f not in image_files]
+                # Categorize files in a single pass as (name, size) tuples
+                xml_files, image_files, other_files = [], [], []
+                has_maindoc = False
+                for info in infos:
+                    name = info.filename
+                    name_lower = name.lower()
+                    entry = (name, info.file_size)
+                    if name_lower.endswith('.xml'):
+                        xml_files.append(entry)
+                        has_maindoc = has_maindoc or name == 'maindoc.xml'
+                    elif name_lower.endswith(IMAGE_EXTS):
+                        image_files.append(entry)
+                    else:
+                        other_files.append(entry)
             
-            print("📄 XML Files:")
-            for f in xml_files:
-                size = kra.getinfo(f).file_size
-                print(f"   - {f} ({size} bytes)")
+                print("📄 XML Files:")
+                if xml_files:
+                    print("\n".join(f"   - {f} ({size} bytes)" for f, size in xml_files))
             
-            print("\n🖼️  Image Files:")
-            for f in image_files:
-                size = kra.getinfo(f).file_size
-                print(f"   - {f} ({size} bytes)")
+                print("\n🖼️  Image Files:")
+                if image_files:
+                    print("\n".join(f"   - {f} ({size} bytes)" for f, size in image_files))
             
-            if other_files:
-                print("\n📦 Other Files:")
-                for f in other_files[:10]:  # Limit to 10
-                    size = kra.getinfo(f).file_size
-                    print(f"   - {f} ({size} bytes)")
-                if len(other_files) > 10:
-                    print(f"   ... and {len(other_files) - 10} more")
+                if other_files:
+                    print("\n📦 Other Files:")
+                    total_other = len(other_files)
+                    out = [f"   - {f} ({size} bytes)" for f, size in itertools.islice(other_files, 10)]  # Limit to 10
+                    if total_other > 10:
+                        out.append(f"   ... and {total_other - 10} more")
+                    print("\n".join(out))
             
             # Step 2: Parse maindoc.xml
             print("\n" + "-" * 70)
             print("STEP 2: Parsing maindoc.xml")
             print("-" * 70)
             
-            if 'maindoc.xml' not in file_list:
+            if not fast and not has_maindoc:
                 print("❌ maindoc.xml not found in archive!")
                 return
             
-            xml_data = kra.read('maindoc.xml')
-            tree = ET.fromstring(xml_data)
+            try:
+                xml_stream = open_maindoc(kra)
+            except KeyError:
+                print("❌ maindoc.xml not found in archive!")
+                return
+            try:
+                scan = scan_maindoc(xml_stream)
+            finally:
+                xml_stream.close()
             
-            print(f"Root element: <{tree.tag}>")
-            print(f"Root attributes: {dict(tree.attrib)}")
+            print(f"Parser: {'lxml' if HAS_LXML else 'xml.etree (stdlib)'}")
+            print(f"Root element: <{scan['root_tag']}>")
+            print(f"Root attributes: {scan['root_attrs']}")
             
             # Step 3: Search for reference-related nodes
             print("\n" + "-" * 70)
             print("STEP 3: Searching for reference-related nodes")
             print("-" * 70)
             
-            ref_results = search_xml_for_references(tree)
+            ref_results = scan['references']
             
             if ref_results:
                 print(f"✅ Found {len(ref_results)} reference-related nodes:\n")
@@ -172,41 +314,27 @@ def inspect_kra_file(kra_path):
             print("STEP 4: XML Structure (first 2 levels)")
             print("-" * 70)
             
-            print(f"<{tree.tag}>")
-            for child in tree:
-                print(f"  <{child.tag}> ({len(child)} children)")
-                for subchild in child:
-                    attrs = " ".join(f'{k}="{v}"' for k, v in list(subchild.attrib.items())[:2])
+            print(f"<{scan['root_tag']}>")
+            for child_tag, child_count, subchildren in scan['structure']:
+                print(f"  <{child_tag}> ({child_count} children)")
+                for subchild_tag, subchild_attrs, subchild_count in subchildren:
+                    attrs = " ".join(f'{k}="{v}"' for k, v in subchild_attrs)
                     if attrs:
-                        print(f"    <{subchild.tag} {attrs}... > ({len(subchild)} children)")
+                        print(f"    <{subchild_tag} {attrs}... > ({subchild_count} children)")
                     else:
-                        print(f"    <{subchild.tag}> ({len(subchild)} children)")
+                        print(f"    <{subchild_tag}> ({subchild_count} children)")
             
             # Step 5: Check specific paths
             print("\n" + "-" * 70)
             print("STEP 5: Checking common reference image paths")
             print("-" * 70)
             
-            common_paths = [
-                './/REFERENCEIMAGES',
-                './/referenceimages',
-                './/ReferenceImages',
-                './/reference-images',
-                './/REFERENCEIMAGE',
-                './/referenceimage',
-                './/ASSISTANT',
-                './/assistant',
-                './/IMAGE[@type="reference"]',
-                './/image[@type="reference"]',
-            ]
-            
-            for xpath in common_paths:
-                results = tree.findall(xpath)
-                if results:
-                    print(f"✅ Found {len(results)} node(s) at: {xpath}")
-                    for node in results:
-                        print(f"   Tag: {node.tag}")
-                        print(f"   Attrs: {dict(node.attrib)}")
+            for xpath, nodes in scan['common_paths'].items():
+                if nodes:
+                    print(f"✅ Found {len(nodes)} node(s) at: {xpath}")
+                    for node_tag, node_attrs in nodes:
+                        print(f"   Tag: {node_tag}")
+                        print(f"   Attrs: {node_attrs}")
                 else:
                     print(f"❌ Not found: {xpath}")
             
@@ -216,13 +344,16 @@ def inspect_kra_file(kra_path):
             print("-" * 70)
             print("(Limited to first 100 lines, save to file for full output)\n")
             
-            xml_str = ET.tostring(tree, encoding='unicode', method='xml')
-            lines = xml_str.split('\n')
-            for i, line in enumerate(lines[:100], 1):
-                print(f"{i:4}: {line}")
+            with io.TextIOWrapper(open_maindoc(kra), encoding='utf-8', errors='replace') as text_stream:
+                truncated = False
+                for i, line in iter_capped_lines(text_stream, XML_DUMP_LINES):
+                    if i > XML_DUMP_LINES:
+                        truncated = True
+                        break
+                    print(f"{i:4}: {line}")
             
-            if len(lines) > 100:
-                print(f"\n... and {len(lines) - 100} more lines")
+            if truncated:
+                print(f"\n... output truncated at {XML_DUMP_LINES} lines")
                 print("\n💾 To see full XML, save to file:")
                 print(f"   unzip -p '{kra_path}' maindoc.xml > maindoc_extracted.xml")
     
@@ -246,15 +377,13 @@ def inspect_kra_file(kra_path):
     print("=" * 70)
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 inspect-kra-references.py <path-to-kra-file>")
-        print()
-        print("Example:")
-        print("  python3 debug/inspect-kra-references.py ~/Documents/reference-test.kra")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Inspect .kra file structure to find where reference images are stored.",
+        epilog="Example: python3 debug/inspect-kra-references.py ~/Documents/reference-test.kra",
+    )
+    parser.add_argument("kra_path", help="path to the .kra file")
+    parser.add_argument("--fast", action="store_true",
+                        help="skip the archive listing and only inspect maindoc.xml")
+    args = parser.parse_args()
     
-    kra_path = sys.argv[1]
-    inspect_kra_file(kra_path)
-
-
-
+    inspect_kra_file(args.kra_path, fast=args.fast)
@@ -13,7 +13,18 @@ plugin_path = os.path.join(os.path.dirname(__file__), '..', 'krita-plugin', 'chm
 sys.path.insert(0, plugin_path)
 
 from api_client import CHMApiClient
-import json
+
+# Prefer orjson's C encoder for dumping responses, fall back to stdlib json
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    import json
+
+    def dumps(obj):
+        return json.dumps(obj, indent=2)
 
 print("=" * 60)
 print("Testing CHM API Client - Server-Side Signing")
@@ -93,7 +104,7 @@ try:
     else:
         print("❌ ERROR: No signature in response")
         print()
-        print(f"Full response: {json.dumps(result, indent=2)}")
+        print(f"Full response: {dumps(result)}")
         sys.exit(1)
         
 except Exception as e:
@@ -8,13 +8,20 @@ without signing issues. Run this with Krita's Python interpreter.
 
 import sys
 import os
+import logging
 
 DEBUG_LOG = True
 
+logger = logging.getLogger("c2pa-test")
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("[C2PA-TEST] %(message)s"))
+logger.addHandler(_handler)
+logger.setLevel(logging.DEBUG if DEBUG_LOG else logging.WARNING)
+logger.propagate = False
+
 def log(message):
     """Debug logging helper"""
-    if DEBUG_LOG:
-        print(f"[C2PA-TEST] {message}")
+    logger.debug(message)
 
 def test_c2pa_import():
     """Test if c2pa-python can be imported"""
@@ -48,9 +55,9 @@ def test_create_claim():
         return True
         
     except Exception as e:
-        log(f"❌ Failed to create claim: {e}")
-        import traceback
-        log(f"   Traceback: {traceback.format_exc()}")
+        # Debug level keeps this quiet unless DEBUG_LOG is on; the traceback is
+        # only formatted if a handler actually emits the record
+        logger.debug("❌ Failed to create claim: %s", e, exc_info=True)
         return False
 
 def main():
@@ -10,12 +10,35 @@ import sys
 import os
 import json
 import tempfile
+import traceback
+
+# Compact JSON bytes for the manifest size log (orjson if installed)
+try:
+    import orjson
+
+    def dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 # Add krita-plugin directory to path to import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'krita-plugin'))
 
 DEBUG_LOG = True
 
+# Encode the solid-red test image once at import time (None if Pillow is missing)
+try:
+    import io
+    from PIL import Image
+    
+    _buf = io.BytesIO()
+    Image.new('RGB', (100, 100), color='red').save(_buf, format='PNG')
+    RED_100_PNG = _buf.getvalue()
+    del _buf
+except ImportError:
+    RED_100_PNG = None
+
 def log(message):
     """Debug logging helper"""
     if DEBUG_LOG:
@@ -25,23 +48,20 @@ def create_test_png():
     """Create a simple test PNG image"""
     log("Creating test PNG image...")
     
+    if RED_100_PNG is None:
+        log("❌ Pillow not available - cannot create test PNG")
+        log("   Install with: pip3 install Pillow")
+        return None
+    
     try:
-        from PIL import Image
-        
-        # Create test image
-        img = Image.new('RGB', (100, 100), color='red')
-        
-        # Save to temp file
-        temp_png = tempfile.mktemp(suffix='.png')
-        img.save(temp_png)
+        # Write the pre-encoded image to a temp file (the embedder works on paths)
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
+            f.write(RED_100_PNG)
+            temp_png = f.name
         
         log(f"✅ Test PNG created: {temp_png}")
         return temp_png
         
-    except ImportError:
-        log("❌ Pillow not available - cannot create test PNG")
-        log("   Install with: pip3 install Pillow")
-        return None
     except Exception as e:
         log(f"❌ Error creating PNG: {e}")
         return None
@@ -74,7 +94,7 @@ def create_test_manifest():
         ]
     }
     
-    log(f"✅ Test manifest created ({len(json.dumps(manifest))} bytes)")
+    log(f"✅ Test manifest created ({len(dumps(manifest))} bytes)")
     return manifest
 
 def test_c2pa_python_embedding(png_path, manifest):
@@ -100,8 +120,8 @@ def test_c2pa_python_embedding(png_path, manifest):
         return False
     except Exception as e:
         log(f"❌ Error: {e}")
-        import traceback
-        log(traceback.format_exc())
+        if DEBUG_LOG:  # formatting walks the whole stack; skip it when not logged
+            log(traceback.format_exc())
         return False
 
 def test_fallback_png_embedding(png_path, manifest):
@@ -125,6 +145,10 @@ def test_fallback_png_embedding(png_path, manifest):
             file_size = os.path.getsize(png_path)
             log(f"   File size: {file_size} bytes")
             
+            # Hash the embedded PNG the same way proofs do (streamed, not read whole)
+            from chm_verifier.chm_core import sha256_file
+            log(f"   SHA-256: {sha256_file(png_path)}")
+            
             return True
         else:
             log("❌ FAILED: Fallback embedding failed")
@@ -135,8 +159,8 @@ def test_fallback_png_embedding(png_path, manifest):
         return False
     except Exception as e:
         log(f"❌ Error: {e}")
-        import traceback
-        log(traceback.format_exc())
+        if DEBUG_LOG:  # formatting walks the whole stack; skip it when not logged
+            log(traceback.format_exc())
         return False
 
 def test_manifest_extraction(png_path):
@@ -164,8 +188,8 @@ def test_manifest_extraction(png_path):
             
     except Exception as e:
         log(f"❌ Error: {e}")
-        import traceback
-        log(traceback.format_exc())
+        if DEBUG_LOG:  # formatting walks the whole stack; skip it when not logged
+            log(traceback.format_exc())
         return False
 
 def main():
@@ -15,6 +15,20 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'krita-plugin')
 
 from chm_verifier.c2pa_builder import CHMtoC2PABuilder, run_privacy_audit
 
+# Prefer orjson's C encoder for manifest serialization, fall back to stdlib json.
+# dumps() returns bytes in both cases so len() reports the encoded size.
+try:
+    import orjson
+
+    def dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    def dumps(obj, indent=False):
+        # Match orjson's output (compact, or 2-space indent) so sizes don't depend on the backend
+        if indent:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 DEBUG_LOG = True
 
 def create_test_session_proof():
@@ -36,6 +50,10 @@ def create_test_session_proof():
         "start_time": "2025-12-30T10:00:00Z"
     }
 
+# The proof never changes between tests, so build it once and pass the dict
+# straight to the builder (no JSON round-trip)
+PROOF = create_test_session_proof()
+
 def test_privacy_lite_mode():
     """Test that LITE mode doesn't leak sensitive data"""
     print("=" * 60)
@@ -44,11 +62,10 @@ def test_privacy_lite_mode():
     print()
     
     builder = CHMtoC2PABuilder(debug_log=DEBUG_LOG)
-    proof = create_test_session_proof()
     
     # Generate manifest in LITE mode (privacy-preserving)
     manifest = builder.generate_manifest(
-        session_proof_json=json.dumps(proof),
+        session_proof_dict=PROOF,
         privacy_mode="lite"
     )
     
@@ -56,7 +73,7 @@ def test_privacy_lite_mode():
         print("❌ FAILED: Could not generate manifest")
         return False
     
-    print(f"Manifest generated ({len(json.dumps(manifest))} bytes)")
+    print(f"Manifest generated ({len(dumps(manifest))} bytes)")
     print()
     
     # Run privacy audit
@@ -79,11 +96,10 @@ def test_privacy_full_mode():
     print()
     
     builder = CHMtoC2PABuilder(debug_log=DEBUG_LOG)
-    proof = create_test_session_proof()
     
     # Generate manifest in FULL mode (detailed provenance)
     manifest = builder.generate_manifest(
-        session_proof_json=json.dumps(proof),
+        session_proof_dict=PROOF,
         privacy_mode="full"
     )
     
@@ -91,7 +107,7 @@ def test_privacy_full_mode():
         print("❌ FAILED: Could not generate manifest")
         return False
     
-    print(f"Manifest generated ({len(json.dumps(manifest))} bytes)")
+    print(f"Manifest generated ({len(dumps(manifest))} bytes)")
     print()
     
     # Run privacy audit (should still pass - no coordinates/layer names even in full mode)
@@ -114,29 +130,32 @@ def test_manifest_contents():
     print()
     
     builder = CHMtoC2PABuilder(debug_log=False)  # Disable debug for cleaner output
-    proof = create_test_session_proof()
     
     manifest_lite = builder.generate_manifest(
-        session_proof_json=json.dumps(proof),
+        session_proof_dict=PROOF,
         privacy_mode="lite"
     )
     
     manifest_full = builder.generate_manifest(
-        session_proof_json=json.dumps(proof),
+        session_proof_dict=PROOF,
         privacy_mode="full"
     )
     
+    # Serialize each manifest once; the same bytes are printed and measured
+    blob_lite = dumps(manifest_lite, indent=True)
+    blob_full = dumps(manifest_full, indent=True)
+    
     print("LITE MODE Manifest Structure:")
-    print(json.dumps(manifest_lite, indent=2))
+    print(blob_lite.decode())
     print()
     
     print("\nFULL MODE Manifest Structure:")
-    print(json.dumps(manifest_full, indent=2))
+    print(blob_full.decode())
     print()
     
-    # Compare sizes
-    lite_size = len(json.dumps(manifest_lite))
-    full_size = len(json.dumps(manifest_full))
+    # Compare sizes (pretty-printed)
+    lite_size = len(blob_lite)
+    full_size = len(blob_full)
     
     print(f"Size comparison:")
     print(f"  LITE: {lite_size} bytes")
@@ -153,30 +172,28 @@ def main():
     print("=" * 60)
     print()
     
-    results = []
+    tests = [
+        ("LITE Mode Privacy", test_privacy_lite_mode),      # Test 1: LITE mode privacy
+        ("FULL Mode Privacy", test_privacy_full_mode),      # Test 2: FULL mode privacy
+        ("Manifest Inspection", test_manifest_contents),    # Test 3: Manifest contents
+    ]
     
-    # Test 1: LITE mode privacy
-    results.append(("LITE Mode Privacy", test_privacy_lite_mode()))
-    
-    # Test 2: FULL mode privacy
-    results.append(("FULL Mode Privacy", test_privacy_full_mode()))
-    
-    # Test 3: Manifest contents
-    results.append(("Manifest Inspection", test_manifest_contents()))
+    # Each test prints its own report; keep only the summary lines and a failure count
+    summary = []
+    failures = 0
+    for test_name, test_func in tests:
+        passed = test_func()
+        failures += not passed
+        summary.append(f"{test_name}: {'✅ PASS' if passed else '❌ FAIL'}")
     
     # Summary
     print("\n" + "=" * 60)
     print("AUDIT SUMMARY")
     print("=" * 60)
-    
-    for test_name, passed in results:
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{test_name}: {status}")
-    
-    all_passed = all(result[1] for result in results)
+    print("\n".join(summary))
     
     print()
-    if all_passed:
+    if failures == 0:
         print("✅ ALL PRIVACY AUDITS PASSED")
         print()
         print("C2PA manifests are privacy-preserving:")
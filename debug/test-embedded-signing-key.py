@@ -12,11 +12,16 @@ Usage:
     python3 debug/test-embedded-signing-key.py
 """
 
+import io
 import os
 import sys
 import base64
 import tempfile
 import shutil
+import threading
+import traceback
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Color codes for output
 GREEN = '\033[92m'
@@ -34,6 +39,11 @@ def print_info(msg):
     print(f"{YELLOW}ℹ{RESET} {msg}")
 
 
+def find_literals(content, literals):
+    """Return the set of literal strings that occur in content"""
+    return {literal for literal in literals if literal in content}
+
+
 def test_signing_key_exists():
     """Test that developer has a signing key"""
     print("\n" + "="*70)
@@ -42,17 +52,16 @@ def test_signing_key_exists():
     
     key_file = os.path.expanduser("~/.config/chm/signing_key.txt")
     
-    if not os.path.exists(key_file):
+    # Read and validate key (one open instead of an exists() check plus open)
+    try:
+        key = Path(key_file).read_text().strip()
+    except FileNotFoundError:
         print_error(f"No signing key found at: {key_file}")
         print_info("Run: python3 scripts/generate-signing-key.py --auto-generate")
         return False
     
     print_success(f"Signing key found: {key_file}")
     
-    # Read and validate key
-    with open(key_file, 'r') as f:
-        key = f.read().strip()
-    
     try:
         decoded = base64.b64decode(key)
         print_success(f"Key is valid base64 ({len(decoded)} bytes)")
@@ -71,32 +80,27 @@ def test_embedded_key_creation():
     
     key_file = os.path.expanduser("~/.config/chm/signing_key.txt")
     
-    if not os.path.exists(key_file):
+    try:
+        signing_key = Path(key_file).read_text().strip()
+    except FileNotFoundError:
         print_error("Signing key not found (run TEST 1 first)")
         return False
     
-    with open(key_file, 'r') as f:
-        signing_key = f.read().strip()
-    
     # Create temp embedded key file
     temp_dir = tempfile.mkdtemp()
     embedded_file = os.path.join(temp_dir, "signing_key_embedded.py")
     
     try:
-        # Simulate build script logic
+        # Simulate build script logic: render the whole module and write it once.
+        # The key is already base64, so it is embedded as a single literal rather
+        # than a list of chunks joined at import time.
         with open(embedded_file, 'w') as f:
-            f.write('# Auto-generated during build - DO NOT EDIT\n')
-            f.write('def get_embedded_key():\n')
-            f.write('    """Return the embedded signing key"""\n')
-            f.write('    parts = [\n')
-            
-            # Split key into 20-char chunks
-            for i in range(0, len(signing_key), 20):
-                chunk = signing_key[i:i+20]
-                f.write(f'        "{chunk}",\n')
-            
-            f.write('    ]\n')
-            f.write('    return "".join(parts)\n')
+            f.write(
+                '# Auto-generated during build - DO NOT EDIT\n'
+                'def get_embedded_key():\n'
+                '    """Return the embedded signing key"""\n'
+                f'    return "{signing_key}"\n'
+            )
         
         print_success(f"Created embedded key file: {embedded_file}")
         
@@ -118,7 +122,6 @@ def test_embedded_key_creation():
             
     except Exception as e:
         print_error(f"Failed to create/test embedded key: {e}")
-        import traceback
         traceback.print_exc()
         return False
     finally:
@@ -137,27 +140,30 @@ def test_plugin_key_loading():
     # Check if plugin file exists
     plugin_file = "krita-plugin/chm_verifier/chm_extension.py"
     
-    if not os.path.exists(plugin_file):
+    try:
+        content = Path(plugin_file).read_text()
+    except FileNotFoundError:
         print_error(f"Plugin file not found: {plugin_file}")
         return False
     
     print_success(f"Plugin file found: {plugin_file}")
     
     # Check for embedded key import
-    with open(plugin_file, 'r') as f:
-        content = f.read()
     
-    if 'from .signing_key_embedded import get_embedded_key' in content:
-        print_success("Plugin imports embedded key module")
-    else:
-        print_error("Plugin does NOT import embedded key module")
-        return False
+    checks = [
+        ("from .signing_key_embedded import get_embedded_key",
+         "Plugin imports embedded key module", "Plugin does NOT import embedded key module"),
+        ("Step 1: Checking embedded key (production)",
+         "Plugin checks embedded key first (production mode)", "Plugin does not prioritize embedded key"),
+    ]
+    hits = find_literals(content, [check_str for check_str, _, _ in checks])
     
-    if 'Step 1: Checking embedded key (production)' in content:
-        print_success("Plugin checks embedded key first (production mode)")
-    else:
-        print_error("Plugin does not prioritize embedded key")
-        return False
+    for check_str, success_msg, error_msg in checks:
+        if check_str in hits:
+            print_success(success_msg)
+        else:
+            print_error(error_msg)
+            return False
     
     return True
 
@@ -170,15 +176,14 @@ def test_build_script():
     
     build_script = "scripts/package-release.sh"
     
-    if not os.path.exists(build_script):
+    try:
+        content = Path(build_script).read_text()
+    except FileNotFoundError:
         print_error(f"Build script not found: {build_script}")
         return False
     
     print_success(f"Build script found: {build_script}")
     
-    with open(build_script, 'r') as f:
-        content = f.read()
-    
     checks = [
         ("SIGNING_KEY_FILE=", "Defines signing key file path"),
         ("generate-signing-key.py --auto-generate", "Auto-generates key if missing"),
@@ -186,9 +191,11 @@ def test_build_script():
         ("get_embedded_key()", "Includes key retrieval function"),
     ]
     
+    hits = find_literals(content, [check_str for check_str, _ in checks])
+    
     all_passed = True
     for check_str, description in checks:
-        if check_str in content:
+        if check_str in hits:
             print_success(description)
         else:
             print_error(f"Missing: {description}")
@@ -205,13 +212,12 @@ def test_gitignore():
     
     gitignore_file = ".gitignore"
     
-    if not os.path.exists(gitignore_file):
+    try:
+        content = Path(gitignore_file).read_text()
+    except FileNotFoundError:
         print_error(f".gitignore not found")
         return False
     
-    with open(gitignore_file, 'r') as f:
-        content = f.read()
-    
     if 'signing_key_embedded.py' in content:
         print_success("Embedded key file is in .gitignore")
         print_info("This prevents accidental commits of the signing key")
@@ -222,6 +228,49 @@ def test_gitignore():
         return False
 
 
+class _ThreadLocalStdout:
+    """stdout proxy that sends writes to a per-thread buffer when one is set"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer):
+        self._local.buffer = buffer
+    
+    def release(self):
+        self._local.buffer = None
+    
+    def write(self, text):
+        return (getattr(self._local, 'buffer', None) or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+def run_test(test_func):
+    """Run a single test, treating a crash as a failure"""
+    try:
+        return test_func()
+    except Exception as e:
+        print_error(f"Test crashed: {e}")
+        # Through sys.stdout so a background test's traceback is buffered with
+        # the rest of its output and replayed in order
+        traceback.print_exc(file=sys.stdout)
+        return False
+
+
+def run_test_buffered(stdout, test_func):
+    """Run a test in a worker thread, returning (result, captured output)"""
+    buffer = io.StringIO()
+    stdout.capture(buffer)
+    try:
+        result = run_test(test_func)
+    finally:
+        stdout.release()
+    return result, buffer.getvalue()
+
+
 def main():
     """Run all tests"""
     print("="*70)
@@ -242,15 +291,28 @@ def main():
     
     results = []
     
-    for name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print_error(f"Test crashed: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
+    real_stdout = sys.stdout
+    stdout = _ThreadLocalStdout(real_stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests) - 2) as executor:
+            # Tests 3-5 only read their own files, so they run in the background
+            # while tests 1 -> 2 run in order (test 2 needs the key from test 1).
+            # Their output is buffered and replayed in order afterwards.
+            background = [
+                (name, executor.submit(run_test_buffered, stdout, test_func))
+                for name, test_func in tests[2:]
+            ]
+            
+            for name, test_func in tests[:2]:
+                results.append((name, run_test(test_func)))
+            
+            for name, future in background:
+                result, output = future.result()
+                sys.stdout.write(output)
+                results.append((name, result))
+    finally:
+        sys.stdout = real_stdout
     
     # Summary
     print("\n" + "="*70)
@@ -258,10 +320,11 @@ def main():
     print("="*70)
     print()
     
-    passed = sum(1 for _, result in results if result)
     total = len(results)
+    passed = 0
     
     for name, result in results:
+        passed += bool(result)
         status = f"{GREEN}PASS{RESET}" if result else f"{RED}FAIL{RESET}"
         print(f"  {status}  {name}")
     
@@ -8,6 +8,7 @@ Python standard library (no external dependencies).
 
 import sys
 import os
+import traceback
 
 # Add parent directory to path to import from krita-plugin
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'krita-plugin'))
@@ -17,9 +18,9 @@ import hashlib
 from datetime import datetime
 
 def generate_test_hash():
-    """Generate a test proof hash"""
+    """Generate a test proof hash (raw 32-byte SHA-256 digest)"""
     test_data = f"CHM_TEST_PROOF_{datetime.utcnow().isoformat()}"
-    return hashlib.sha256(test_data.encode()).hexdigest()
+    return hashlib.sha256(test_data.encode()).digest()
 
 def main():
     print("=" * 60)
@@ -53,8 +54,8 @@ def main():
     print()
     
     # Generate test proof hash
-    proof_hash = generate_test_hash()
-    print(f"Test proof hash: {proof_hash}")
+    proof_digest = generate_test_hash()
+    print(f"Test proof hash: {proof_digest.hex()}")
     print()
     
     # Create test proof context
@@ -69,7 +70,7 @@ def main():
     print("-" * 60)
     
     try:
-        results = service.submit_proof_hash(proof_hash, proof_dict)
+        results = service.submit_proof_hash_bytes(proof_digest, proof_dict)
         
         print()
         print("=" * 60)
@@ -85,6 +86,16 @@ def main():
             print(f"  URL: {results['github']['url']}")
             print(f"  Timestamp: {results['github']['timestamp']}")
             print(f"  Commit SHA: {results['github'].get('commit_sha', 'N/A')}")
+            
+            # Read the hash back; the second lookup should be a cached 304
+            gist_id = results['github']['url'].rstrip('/').rsplit('/', 1)[-1]
+            for attempt in (1, 2):
+                try:
+                    stored_hash = service.fetch_gist_file_hash(gist_id)
+                    match = "matches" if stored_hash == proof_dict['file_hash'] else "MISMATCH"
+                    print(f"  Gist lookup {attempt}: file hash {match}")
+                except Exception as e:
+                    print(f"  Gist lookup {attempt} failed: {e}")
         else:
             print("✗ GitHub Gist: Failed")
             if results['errors']:
@@ -115,7 +126,6 @@ def main():
         print("ERROR")
         print("=" * 60)
         print(f"Test failed with exception: {e}")
-        import traceback
         traceback.print_exc()
         return 1
     
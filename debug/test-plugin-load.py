@@ -2,11 +2,18 @@
 """
 Test script to verify CHM plugin can be imported and loaded.
 Run this from the command line to test plugin without Krita.
+
+Usage:
+    python3 debug/test-plugin-load.py [--verbose]
+
+--verbose also lists the contents of the plugin's lib/ directory.
 """
 
 import sys
 import os
 
+VERBOSE = "--verbose" in sys.argv[1:]
+
 print("=" * 60)
 print("CHM Plugin Load Test")
 print("=" * 60)
@@ -22,11 +29,39 @@ else:
 
 plugin_path = os.path.join(plugin_base, "chm_verifier")
 
+
+# List each directory once; the checks below look names up in these dicts
+# and reuse the DirEntry stat cache instead of probing paths one by one
+def scan_dir(path):
+    """Return {name: DirEntry} for a directory, or None if it can't be listed"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None
+
+
+def tail_lines(path, n, block_size=4096):
+    """Return the last n lines of a file, reading backwards from the end"""
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        while True:
+            start = max(0, size - block_size)
+            f.seek(start)
+            lines = f.read().decode('utf-8', 'replace').splitlines()
+            # The first line is partial unless the read began at offset 0
+            if start == 0 or len(lines) > n:
+                return lines[-n:]
+            block_size *= 2
+
+
+plugin_entries = scan_dir(plugin_path)
+
 print(f"Plugin path: {plugin_path}")
-print(f"Exists: {os.path.exists(plugin_path)}")
+print(f"Exists: {plugin_entries is not None}")
 print()
 
-if not os.path.exists(plugin_path):
+if plugin_entries is None:
     print("ERROR: Plugin directory not found!")
     print(f"Expected: {plugin_path}")
     sys.exit(1)
@@ -37,10 +72,10 @@ sys.path.insert(0, os.path.dirname(plugin_path))
 # Test 1: Import __init__.py
 print("Test 1: Checking __init__.py...")
 print("-" * 40)
-init_file = os.path.join(plugin_path, "__init__.py")
-if os.path.exists(init_file):
+init_entry = plugin_entries.get("__init__.py")
+if init_entry:
     print(f"✓ __init__.py exists")
-    print(f"  Size: {os.path.getsize(init_file)} bytes")
+    print(f"  Size: {init_entry.stat().st_size} bytes")
 else:
     print("✗ __init__.py missing!")
     sys.exit(1)
@@ -50,16 +85,20 @@ print()
 print("Test 2: Checking Rust library...")
 print("-" * 40)
 lib_dir = os.path.join(plugin_path, "lib")
-if os.path.exists(lib_dir):
+lib_dir_entry = plugin_entries.get("lib")
+if lib_dir_entry and lib_dir_entry.is_dir():
     print(f"✓ lib directory exists")
-    lib_files = os.listdir(lib_dir)
-    print(f"  Contents: {lib_files}")
     
-    # Check for chm.so
-    lib_file = os.path.join(lib_dir, "chm.so")
-    if os.path.exists(lib_file):
+    # Check for chm.so (stops at the first match unless listing everything)
+    with os.scandir(lib_dir) as it:
+        lib_entries = list(it) if VERBOSE else it
+        if VERBOSE:
+            print(f"  Contents: {[entry.name for entry in lib_entries]}")
+        lib_entry = next((entry for entry in lib_entries if entry.name == "chm.so"), None)
+    
+    if lib_entry:
         print(f"✓ chm.so exists")
-        print(f"  Size: {os.path.getsize(lib_file)} bytes")
+        print(f"  Size: {lib_entry.stat().st_size} bytes")
         
         # Try to import
         sys.path.insert(0, lib_dir)
@@ -103,8 +142,7 @@ required_files = [
 ]
 
 for filename in required_files:
-    filepath = os.path.join(plugin_path, filename)
-    if os.path.exists(filepath):
+    if filename in plugin_entries:
         print(f"✓ {filename}")
     else:
         print(f"✗ {filename} MISSING")
@@ -136,10 +174,8 @@ if os.path.exists(log_file):
     print(f"✓ Debug log exists: {log_file}")
     print()
     print("  Last 15 lines:")
-    with open(log_file, 'r') as f:
-        lines = f.readlines()
-        for line in lines[-15:]:
-            print(f"    {line.rstrip()}")
+    for line in tail_lines(log_file, 15):
+        print(f"    {line.rstrip()}")
 else:
     print(f"⚠ Debug log not found: {log_file}")
     print("  This means the plugin has never loaded in Krita")
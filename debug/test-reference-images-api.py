@@ -11,8 +11,18 @@ Run this from Krita's Script Docker:
 Or save as plugin and run via Python Plugin Manager.
 """
 
+import re
+
 from krita import Krita
 
+# Keywords for the TEST 6 heuristic scan, matched against lowercased names
+REFERENCE_KEYWORDS_SEARCH = re.compile(
+    'reference|ref|image|import|resource|attach|embed|external|link'
+).search
+
+# Keywords for the TEST 7 .kra metadata scan
+KRA_METADATA_SEARCH = re.compile('annotation|metadata').search
+
 def test_reference_images_api():
     """Test all possible ways to access reference images via Krita Python API"""
     
@@ -30,12 +40,35 @@ def test_reference_images_api():
     print(f"\n✅ Active document: {doc.name()}")
     print(f"   Krita version: {app.version()}")
     
+    # When the dedicated API exists, the heuristic scans (TESTs 6-7) are skipped
+    has_api = hasattr(doc, 'referenceImages')
+    
+    # Scan Document attributes once: dir() and lower() per name, then sort
+    # them into every category the tests below report on
+    all_methods = []
+    doc_methods = []                  # TEST 3: 'reference'
+    possible_reference_methods = []   # TEST 6: any reference keyword
+    kra_methods = []                  # TEST 7: annotation / metadata
+    for m in dir(doc):
+        if m.startswith('_'):
+            continue
+        lo = m.lower()
+        all_methods.append(m)
+        if 'reference' in lo:
+            doc_methods.append(m)
+        if has_api:
+            continue
+        if REFERENCE_KEYWORDS_SEARCH(lo):
+            possible_reference_methods.append(m)
+        if KRA_METADATA_SEARCH(lo):
+            kra_methods.append((m, lo))
+    
     # Test 1: Check if Document has referenceImages() method
     print("\n" + "-" * 60)
     print("TEST 1: Document.referenceImages()")
     print("-" * 60)
     
-    if hasattr(doc, 'referenceImages'):
+    if has_api:
         print("✅ Document.referenceImages() EXISTS!")
         try:
             refs = doc.referenceImages()
@@ -67,7 +100,6 @@ def test_reference_images_api():
     print("TEST 3: All Document methods with 'reference'")
     print("-" * 60)
     
-    doc_methods = [m for m in dir(doc) if 'reference' in m.lower() and not m.startswith('_')]
     if doc_methods:
         print("✅ Found reference-related methods:")
         for method in doc_methods:
@@ -110,49 +142,44 @@ def test_reference_images_api():
         else:
             print("❌ No active view")
     
-    # Test 6: List ALL Document methods (comprehensive)
-    print("\n" + "-" * 60)
-    print("TEST 6: ALL Document methods (for manual review)")
-    print("-" * 60)
-    
-    all_methods = [m for m in dir(doc) if not m.startswith('_')]
-    print(f"Total public methods: {len(all_methods)}")
-    print("\nMethods that might be related to references:")
-    
-    # Look for methods that might relate to references
-    possible_reference_methods = [
-        m for m in all_methods 
-        if any(keyword in m.lower() for keyword in [
-            'reference', 'ref', 'image', 'import', 'resource', 
-            'attach', 'embed', 'external', 'link'
-        ])
-    ]
-    
-    if possible_reference_methods:
-        for method in possible_reference_methods:
-            print(f"   - {method}")
-    else:
-        print("   (None found)")
-    
-    # Test 7: Check for .kra-specific methods
-    print("\n" + "-" * 60)
-    print("TEST 7: .kra metadata methods")
-    print("-" * 60)
-    
-    kra_methods = [m for m in all_methods if 'annotation' in m.lower() or 'metadata' in m.lower()]
-    if kra_methods:
-        print("✅ Found metadata-related methods:")
-        for method in kra_methods:
-            print(f"   - {method}")
-            # Try to call annotation methods
-            if 'annotation' in method.lower() and 'remove' not in method.lower():
-                try:
-                    result = getattr(doc, method)()
-                    print(f"      Result: {result}")
-                except Exception as e:
-                    print(f"      Error: {e}")
+    # TESTs 6-7 are a heuristic search for an API; not needed once TEST 1 found it
+    if has_api:
+        print("\n" + "-" * 60)
+        print("TESTs 6-7: skipped (Document.referenceImages() exists)")
+        print("-" * 60)
     else:
-        print("❌ No metadata methods found")
+        # Test 6: List ALL Document methods (comprehensive)
+        print("\n" + "-" * 60)
+        print("TEST 6: ALL Document methods (for manual review)")
+        print("-" * 60)
+        
+        print(f"Total public methods: {len(all_methods)}")
+        print("\nMethods that might be related to references:")
+        
+        if possible_reference_methods:
+            for method in possible_reference_methods:
+                print(f"   - {method}")
+        else:
+            print("   (None found)")
+        
+        # Test 7: Check for .kra-specific methods
+        print("\n" + "-" * 60)
+        print("TEST 7: .kra metadata methods")
+        print("-" * 60)
+        
+        if kra_methods:
+            print("✅ Found metadata-related methods:")
+            for method, lo in kra_methods:
+                print(f"   - {method}")
+                # Try to call annotation methods
+                if 'annotation' in lo and 'remove' not in lo:
+                    try:
+                        result = getattr(doc, method)()
+                        print(f"      Result: {result}")
+                    except Exception as e:
+                        print(f"      Error: {e}")
+        else:
+            print("❌ No metadata methods found")
     
     # Summary
     print("\n" + "=" * 60)
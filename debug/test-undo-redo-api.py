@@ -11,8 +11,20 @@ This script tests different approaches to detect undo/redo operations:
 Run this in Krita Scripter to see which APIs are available.
 """
 
+import re
 import sys
 
+# Keywords for the TEST 4 attribute scan, matched against lowercased names
+UNDO_KEYWORDS_SEARCH = re.compile('undo|redo|history|stack').search
+
+# (label, QUndoStack getter) pairs printed by TEST 1
+STACK_PROPERTIES = (
+    ("Stack count", "count"),
+    ("Can undo", "canUndo"),
+    ("Can redo", "canRedo"),
+    ("Undo text", "undoText"),
+)
+
 def test_undo_api():
     """Test if we can access Krita's undo/redo system"""
     
@@ -38,33 +50,33 @@ def test_undo_api():
         print("TEST 1: QUndoStack API")
         print("=" * 60)
         
-        if hasattr(doc, 'undoStack'):
+        # Probes use getattr(obj, name, None): one lookup per name, and no
+        # AttributeError is raised and swallowed when the API is missing
+        undo_stack_fn = getattr(doc, 'undoStack', None)
+        if undo_stack_fn is not None:
             print("✅ document.undoStack() EXISTS!")
             try:
-                stack = doc.undoStack()
+                stack = undo_stack_fn()
                 print(f"   Stack object: {stack}")
                 print(f"   Stack type: {type(stack)}")
                 
                 # Try to get stack properties
-                if hasattr(stack, 'count'):
-                    print(f"   Stack count: {stack.count()}")
-                if hasattr(stack, 'canUndo'):
-                    print(f"   Can undo: {stack.canUndo()}")
-                if hasattr(stack, 'canRedo'):
-                    print(f"   Can redo: {stack.canRedo()}")
-                if hasattr(stack, 'undoText'):
-                    print(f"   Undo text: {stack.undoText()}")
+                for label, name in STACK_PROPERTIES:
+                    getter = getattr(stack, name, None)
+                    if getter is not None:
+                        print(f"   {label}: {getter()}")
                 
                 # Try connecting signals
                 print("\n   Testing signal connections:")
-                if hasattr(stack, 'indexChanged'):
+                index_changed = getattr(stack, 'indexChanged', None)
+                if index_changed is not None:
                     print("   ✅ indexChanged signal exists")
-                    stack.indexChanged.connect(lambda idx: print(f"      → indexChanged fired: {idx}"))
+                    index_changed.connect(lambda idx: print(f"      → indexChanged fired: {idx}"))
                     print("      Signal connected! (try undo/redo now)")
                 else:
                     print("   ❌ indexChanged signal NOT found")
                 
-                if hasattr(stack, 'canUndoChanged'):
+                if getattr(stack, 'canUndoChanged', None) is not None:
                     print("   ✅ canUndoChanged signal exists")
                 else:
                     print("   ❌ canUndoChanged signal NOT found")
@@ -82,7 +94,7 @@ def test_undo_api():
         
         undo_methods = ['undo', 'redo', 'waitForDone']
         for method in undo_methods:
-            if hasattr(doc, method):
+            if getattr(doc, method, None) is not None:
                 print(f"✅ document.{method}() EXISTS")
             else:
                 print(f"❌ document.{method}() NOT FOUND")
@@ -92,25 +104,29 @@ def test_undo_api():
         print("TEST 3: Krita Action System")
         print("=" * 60)
         
-        if hasattr(app, 'action'):
-            undo_action = app.action('edit_undo')
-            redo_action = app.action('edit_redo')
+        action_fn = getattr(app, 'action', None)
+        undo_action = None
+        if action_fn is not None:
+            undo_action = action_fn('edit_undo')
+            redo_action = action_fn('edit_redo')
             
             if undo_action:
                 print(f"✅ edit_undo action found: {undo_action}")
                 print(f"   Type: {type(undo_action)}")
-                if hasattr(undo_action, 'triggered'):
+                triggered = getattr(undo_action, 'triggered', None)
+                if triggered is not None:
                     print("   ✅ triggered signal exists")
-                    undo_action.triggered.connect(lambda: print("      → UNDO TRIGGERED!"))
+                    triggered.connect(lambda: print("      → UNDO TRIGGERED!"))
                     print("      Signal connected! (try undo now)")
             else:
                 print("❌ edit_undo action NOT FOUND")
             
             if redo_action:
                 print(f"✅ edit_redo action found: {redo_action}")
-                if hasattr(redo_action, 'triggered'):
+                triggered = getattr(redo_action, 'triggered', None)
+                if triggered is not None:
                     print("   ✅ triggered signal exists")
-                    redo_action.triggered.connect(lambda: print("      → REDO TRIGGERED!"))
+                    triggered.connect(lambda: print("      → REDO TRIGGERED!"))
                     print("      Signal connected! (try redo now)")
             else:
                 print("❌ edit_redo action NOT FOUND")
@@ -124,7 +140,7 @@ def test_undo_api():
         
         print("\nSearching for 'undo', 'redo', 'history', 'stack':")
         all_attrs = dir(doc)
-        undo_related = [attr for attr in all_attrs if any(keyword in attr.lower() for keyword in ['undo', 'redo', 'history', 'stack'])]
+        undo_related = [attr for attr in all_attrs if UNDO_KEYWORDS_SEARCH(attr.lower())]
         
         if undo_related:
             for attr in undo_related:
@@ -136,10 +152,10 @@ def test_undo_api():
         print("RECOMMENDATION")
         print("=" * 60)
         
-        if hasattr(doc, 'undoStack'):
+        if undo_stack_fn is not None:
             print("✅ Use QUndoStack signals (Option 2) - BEST APPROACH")
             print("   Connect to indexChanged signal in connect_document_signals()")
-        elif hasattr(app, 'action') and app.action('edit_undo'):
+        elif undo_action:
             print("✅ Use Krita action system (Option 4) - GOOD APPROACH")
             print("   Connect to action.triggered signals")
         else:
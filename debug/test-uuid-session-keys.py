@@ -27,12 +27,12 @@ def test_uuid_session_keys():
     
     app = Krita.instance()
     
-    # Get extension instance
-    extension = None
-    for ext in app.extensions():
-        if hasattr(ext, 'session_manager'):
-            extension = ext
-            break
+    # Get extension instance (registered by the plugin package at load time)
+    try:
+        from chm_verifier import get_chm_extension
+        extension = get_chm_extension()
+    except ImportError:
+        extension = None
     
     if not extension:
         print("❌ FAIL: CHM extension not found")
@@ -135,13 +135,13 @@ def test_uuid_session_keys():
         session_file = storage._get_session_filepath(session_uuid)
         
         import os
-        if os.path.exists(session_file):
-            file_size = os.path.getsize(session_file)
-            print(f"✓ Session file exists: {session_file}")
-            print(f"  File size: {file_size} bytes")
-        else:
+        try:
+            file_size = os.stat(session_file).st_size
+        except FileNotFoundError:
             print(f"❌ FAIL: Session file not found: {session_file}")
             return False
+        print(f"✓ Session file exists: {session_file}")
+        print(f"  File size: {file_size} bytes")
     
     # Test 8: Test session resumption
     print("\n[TEST 8] Testing session resumption...")
@@ -6,6 +6,7 @@ This plugin captures art creation events to generate cryptographic proofs of hum
 
 import sys
 import os
+from datetime import datetime
 
 # Add vendor directory to Python path for bundled libraries (PIL, numpy, etc.)
 vendor_dir = os.path.join(os.path.dirname(__file__), 'vendor')
@@ -14,6 +15,20 @@ if os.path.exists(vendor_dir) and vendor_dir not in sys.path:
     print(f"CHM: Added vendor directory to sys.path: {vendor_dir}")
 
 # Log to both stdout AND a debug file for troubleshooting
+_DEBUG_LOG_DIR = os.path.expanduser("~/.local/share/chm")
+_DEBUG_LOG_FILE = os.path.join(_DEBUG_LOG_DIR, "plugin_debug.log")
+
+# Kept open while this module loads so the ~15 import-time messages share one
+# open(); closed once loading finishes (later calls open the file per message).
+# Every line is still flushed to the OS immediately, so a hard crash
+# mid-import keeps everything logged up to that point.
+_import_log = None
+
+
+def _open_debug_log():
+    return open(_DEBUG_LOG_FILE, "a")
+
+
 def debug_log(message):
     """Write to both console and debug file"""
     # Only print to stdout if it exists (Windows GUI apps may not have stdout)
@@ -27,21 +42,38 @@ def debug_log(message):
     
     # Also write to debug file (more reliable cross-platform)
     try:
-        import os
-        log_dir = os.path.expanduser("~/.local/share/chm")
-        os.makedirs(log_dir, exist_ok=True)
-        log_file = os.path.join(log_dir, "plugin_debug.log")
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        line = f"[{timestamp}] {message}\n"
         
-        with open(log_file, "a") as f:
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"[{timestamp}] {message}\n")
-            f.flush()
+        if _import_log is not None:
+            _import_log.write(line)
+            _import_log.flush()
+        else:
+            with _open_debug_log() as f:
+                f.write(line)
     except Exception as e:
         # Can't log to stdout if it doesn't exist, fail silently
         if sys.stdout is not None:
             print(f"CHM: Could not write to log file: {e}")
 
+
+# The registered CHMExtension, for scripts that need it (see get_chm_extension)
+INSTANCE = None
+
+
+def get_chm_extension():
+    """Return the CHMExtension registered with Krita, or None if loading failed"""
+    return INSTANCE
+
+
+try:
+    # Create the log directory once; debug_log() only ever opens the file
+    os.makedirs(_DEBUG_LOG_DIR, exist_ok=True)
+    _import_log = _open_debug_log()
+except Exception:
+    # debug_log() reports the failure itself when it retries per message
+    _import_log = None
+
 debug_log("=" * 60)
 debug_log("CHM: __init__.py starting to load")
 debug_log("=" * 60)
@@ -66,6 +98,7 @@ try:
     # Register the extension with Krita
     debug_log("CHM: Registering extension with Krita")
     krita_instance.addExtension(extension)
+    INSTANCE = extension
     debug_log("CHM: Plugin registered successfully")
     
 except Exception as e:
@@ -73,3 +106,7 @@ except Exception as e:
     import traceback
     error_details = traceback.format_exc()
     debug_log(f"CHM: Traceback:\n{error_details}")
+finally:
+    if _import_log is not None:
+        _import_log.close()
+        _import_log = None
@@ -14,9 +14,42 @@ SECURITY (BUG-015 FIX):
 
 import json
 import os
+import select
+import ssl
+import traceback
 from datetime import datetime
+from urllib.parse import urlsplit
 import hashlib
 
+# Write debug messages through the package's debug_log() (console + debug
+# file); fall back to print when this module is imported standalone
+try:
+    from . import debug_log as _debug_log
+except ImportError:
+    _debug_log = print
+
+from .http_util import open_connection
+
+def _json_dumps_bytes(obj):
+    """
+    Serialize obj to compact, ASCII-only JSON bytes.
+    
+    The one encoder for the signed request payload, the proofs file and the
+    duplicate index, so their bytes never depend on which JSON library happens
+    to be installed.
+    """
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Error responses are only logged and shown to the user; read at most this much
+MAX_ERROR_BODY_BYTES = 64 * 1024
+
+# Headers sent with every JSON POST to the API server
+API_REQUEST_HEADERS = {
+    'Content-Type': 'application/json',
+    'User-Agent': 'CHM-Krita-Plugin/1.0'
+}
+
 
 class CHMApiClient:
     """Client for CHM backend API (signing + timestamping + storage)"""
@@ -29,6 +62,8 @@ class CHMApiClient:
             config: dict with optional settings:
                 - api_url: Backend API URL (default: https://certified-human-made.org)
                 - timeout: Request timeout in seconds (default: 30)
+                - mode: Proof submission mode (default: 'file_mock', the
+                  local JSONL log; 'http' is not implemented yet)
             debug_log: bool - enable debug logging
         """
         self.config = config or {}
@@ -37,6 +72,20 @@ class CHMApiClient:
         # API configuration
         self.api_url = self.config.get('api_url', 'https://certified-human-made.org')
         self.timeout = self.config.get('timeout', 30)
+        self.mode = self.config.get('mode', 'file_mock')
+        
+        # Persistent connection to the API server (see _api_request)
+        url_parts = urlsplit(self.api_url)
+        self._api_scheme = url_parts.scheme
+        self._api_host = url_parts.hostname
+        self._api_port = url_parts.port
+        self._api_path = url_parts.path.rstrip('/')
+        self._sign_url = f"{self.api_url}/api/sign-and-timestamp"
+        self._sign_path = f"{self._api_path}/api/sign-and-timestamp"
+        self._conn = None
+        self._proxy_prefix = ''
+        self._proxy_headers = {}
+        self._ssl_context = None
         
         # File paths for local storage (duplicate detection, etc.)
         self.data_dir = os.path.expanduser("~/.local/share/chm")
@@ -44,6 +93,13 @@ class CHMApiClient:
         
         self.proofs_file = os.path.join(self.data_dir, "submitted_proofs.jsonl")
         self.duplicates_index = os.path.join(self.data_dir, "file_hash_index.json")
+        # New index entries are appended here, one {file_hash: entry} per line
+        self.duplicates_log = os.path.join(self.data_dir, "file_hash_index.jsonl")
+        # In-memory copy of the duplicates index, loaded on first use
+        self._hash_index = None
+        self._hash_log_partial = False
+        # Number of lines in proofs_file, counted on first get_stats() call
+        self._total_proofs = None
         
         self._log(f"[API-INIT] API Client initialized")
         self._log(f"[API-INIT] API URL: {self.api_url}")
@@ -69,168 +125,254 @@ class CHMApiClient:
                 'error': str - Error message if failed
             }
         """
-        self._log(f"[API-SIGN] ========================================")
-        self._log(f"[API-SIGN] STARTING SERVER SIGNING REQUEST")
-        self._log(f"[API-SIGN] ========================================")
-        self._log(f"[API-SIGN] Session ID: {proof_data.get('session_id', 'unknown')[:16]}...")
-        self._log(f"[API-SIGN] Classification: {proof_data.get('classification')}")
-        self._log(f"[API-SIGN] API URL configured: {self.api_url}")
+        # Success-path log lines are guarded so their f-strings (and the
+        # dict lookups/slicing inside them) aren't built when logging is off
+        if self.debug_log:
+            self._log(f"[API-SIGN] ========================================")
+            self._log(f"[API-SIGN] STARTING SERVER SIGNING REQUEST")
+            self._log(f"[API-SIGN] ========================================")
+            self._log(f"[API-SIGN] Session ID: {proof_data.get('session_id', 'unknown')[:16]}...")
+            self._log(f"[API-SIGN] Classification: {proof_data.get('classification')}")
+            self._log(f"[API-SIGN] API URL configured: {self.api_url}")
         
         try:
-            self._log(f"[API-SIGN] [BFROS-1] Importing urllib modules...")
-            # Use stdlib urllib (Krita doesn't have requests library)
-            import urllib.request
-            import urllib.error
-            import ssl
-            self._log(f"[API-SIGN] [BFROS-1] ✓ urllib modules imported")
-            
             # Prepare request
-            url = f"{self.api_url}/api/sign-and-timestamp"
-            self._log(f"[API-SIGN] [BFROS-2] Target URL: {url}")
+            url = self._sign_url
+            if self.debug_log:
+                self._log(f"[API-SIGN] [BFROS-2] Target URL: {url}")
             
             request_data = {
                 'proof_data': proof_data
             }
             
-            self._log(f"[API-SIGN] [BFROS-3] Encoding request data...")
-            data_bytes = json.dumps(request_data).encode('utf-8')
-            self._log(f"[API-SIGN] [BFROS-3] ✓ Payload size: {len(data_bytes)} bytes")
-            
-            headers = {
-                'Content-Type': 'application/json',
-                'User-Agent': 'CHM-Krita-Plugin/1.0'
-            }
-            self._log(f"[API-SIGN] [BFROS-4] Headers: {headers}")
-            
-            self._log(f"[API-SIGN] [BFROS-5] Creating urllib Request object...")
-            req = urllib.request.Request(url, data=data_bytes, headers=headers, method='POST')
-            self._log(f"[API-SIGN] [BFROS-5] ✓ Request object created")
-            
-            self._log(f"[API-SIGN] [BFROS-6] Creating SSL context...")
+            data_bytes = _json_dumps_bytes(request_data)
+            headers = API_REQUEST_HEADERS
             
-            # Multi-strategy SSL context creation (handles Krita's bundled Python)
-            ssl_context = None
-            ssl_strategy_used = None
-            
-            # Try certifi first (best cross-platform solution)
-            try:
-                import certifi
-                certifi_path = certifi.where()
-                if os.path.isfile(certifi_path):
-                    self._log(f"[API-SIGN] [BFROS-6a] Trying certifi package...")
-                    ssl_context = ssl.create_default_context(cafile=certifi_path)
-                    ssl_strategy_used = "certifi"
-                    self._log(f"[API-SIGN] [BFROS-6a] ✓ Using certifi: {certifi_path}")
-            except ImportError:
-                self._log(f"[API-SIGN] [BFROS-6a] certifi not available")
-            except Exception as e:
-                self._log(f"[API-SIGN] [BFROS-6a] certifi failed: {e}")
-            
-            # Fallback: Try default system context
-            if not ssl_context:
-                try:
-                    self._log(f"[API-SIGN] [BFROS-6b] Trying system default SSL context...")
-                    ssl_context = ssl.create_default_context()
-                    ssl_strategy_used = "system_default"
-                    self._log(f"[API-SIGN] [BFROS-6b] ✓ Using system default context")
-                except Exception as e:
-                    self._log(f"[API-SIGN] [BFROS-6b] System default failed: {e}")
-            
-            # Last resort: Unverified context (INSECURE but functional)
-            # Only for development/testing - logs warning
-            if not ssl_context:
-                self._log(f"[API-SIGN] [BFROS-6c] ⚠️  FALLBACK: Creating unverified SSL context")
-                self._log(f"[API-SIGN] [BFROS-6c] ⚠️  This disables certificate verification!")
-                self._log(f"[API-SIGN] [BFROS-6c] ⚠️  Use only for development/testing")
-                ssl_context = ssl._create_unverified_context()
-                ssl_strategy_used = "unverified"
-            
-            self._log(f"[API-SIGN] [BFROS-6] ✓ SSL context created using: {ssl_strategy_used}")
-            
-            self._log(f"[API-SIGN] [BFROS-7] === MAKING HTTP REQUEST ===")
-            self._log(f"[API-SIGN] [BFROS-7] URL: {url}")
-            self._log(f"[API-SIGN] [BFROS-7] Timeout: {self.timeout}s")
-            self._log(f"[API-SIGN] [BFROS-7] About to call urllib.request.urlopen()...")
+            if self.debug_log:
+                self._log(f"[API-SIGN] [BFROS-3] ✓ Payload size: {len(data_bytes)} bytes")
+                self._log(f"[API-SIGN] [BFROS-4] Headers: {headers}")
+                self._log(f"[API-SIGN] [BFROS-7] === MAKING HTTP REQUEST ===")
+                self._log(f"[API-SIGN] [BFROS-7] URL: {url}")
+                self._log(f"[API-SIGN] [BFROS-7] Timeout: {self.timeout}s")
+                self._log(f"[API-SIGN] [BFROS-7] Connection: {'reused' if self._conn is not None else 'new'}")
             
             # Make request
-            try:
-                with urllib.request.urlopen(req, timeout=self.timeout, context=ssl_context) as response:
-                    self._log(f"[API-SIGN] [BFROS-8] ✓ Got response from server!")
-                    self._log(f"[API-SIGN] [BFROS-8] HTTP Status: {response.status}")
-                    
-                    response_data = response.read().decode('utf-8')
-                    self._log(f"[API-SIGN] [BFROS-9] ✓ Response body read ({len(response_data)} bytes)")
-                    
-                    result = json.loads(response_data)
-                    self._log(f"[API-SIGN] [BFROS-10] ✓ JSON parsed successfully")
-                    
-                    self._log(f"[API-SIGN] ✓ Server response received")
-                    self._log(f"[API-SIGN] ✓ Signature: {result.get('signature', 'MISSING')[:20]}...")
-                    self._log(f"[API-SIGN] ✓ Signature version: {result.get('signature_version')}")
-                    
-                    if result.get('github'):
-                        self._log(f"[API-SIGN] ✓ GitHub timestamp: {result['github']['url']}")
-                    else:
-                        self._log(f"[API-SIGN] ⚠️  No GitHub timestamp (non-fatal)")
-                    
-                    self._log(f"[API-SIGN] ========================================")
-                    self._log(f"[API-SIGN] REQUEST COMPLETED SUCCESSFULLY")
-                    self._log(f"[API-SIGN] ========================================")
-                    return result
-                    
-            except urllib.error.HTTPError as e:
+            status, reason, response_body = self._api_request(
+                'POST', self._sign_path, body=data_bytes, headers=headers
+            )
+            
+            if status >= 400:
                 self._log(f"[API-SIGN] [BFROS-ERROR] ❌ HTTP Error!")
-                self._log(f"[API-SIGN] [BFROS-ERROR] Status code: {e.code}")
-                self._log(f"[API-SIGN] [BFROS-ERROR] Reason: {e.reason}")
+                self._log(f"[API-SIGN] [BFROS-ERROR] Status code: {status}")
+                self._log(f"[API-SIGN] [BFROS-ERROR] Reason: {reason}")
                 
-                error_body = e.read().decode('utf-8') if e.fp else 'No error body'
+                error_body = response_body.decode('utf-8', 'replace') if response_body else 'No error body'
                 self._log(f"[API-SIGN] [BFROS-ERROR] Error body: {error_body}")
                 
-                # Parse error message
-                try:
-                    error_data = json.loads(error_body)
-                    error_message = error_data.get('message', error_body)
-                except:
-                    error_message = error_body
+                # Parse error message (only JSON objects carry one; skip
+                # parsing HTML/plain-text error pages)
+                error_message = error_body
+                if response_body.lstrip()[:1] == b'{':
+                    try:
+                        error_message = json.loads(response_body).get('message', error_body)
+                    except (ValueError, AttributeError):
+                        pass
                 
                 return {
-                    'error': f"Server error ({e.code}): {error_message}"
+                    'error': f"Server error ({status}): {error_message}"
                 }
+            
+            result = json.loads(response_body)
+            
+            if self.debug_log:
+                self._log(f"[API-SIGN] [BFROS-8] ✓ Got response from server!")
+                self._log(f"[API-SIGN] [BFROS-8] HTTP Status: {status}")
+                self._log(f"[API-SIGN] [BFROS-9] ✓ Response body read ({len(response_body)} bytes)")
+                self._log(f"[API-SIGN] [BFROS-10] ✓ JSON parsed successfully")
                 
-            except urllib.error.URLError as e:
-                self._log(f"[API-SIGN] [BFROS-ERROR] ❌ URL/Network Error!")
-                self._log(f"[API-SIGN] [BFROS-ERROR] Error type: {type(e.reason).__name__}")
-                self._log(f"[API-SIGN] [BFROS-ERROR] Error reason: {e.reason}")
-                self._log(f"[API-SIGN] [BFROS-ERROR] This usually means:")
-                self._log(f"[API-SIGN] [BFROS-ERROR]   - DNS resolution failed")
-                self._log(f"[API-SIGN] [BFROS-ERROR]   - Server unreachable")
-                self._log(f"[API-SIGN] [BFROS-ERROR]   - Connection timeout")
-                self._log(f"[API-SIGN] [BFROS-ERROR]   - SSL/TLS handshake failed")
-                
-                return {
-                    'error': f"Network error: {e.reason}. Check internet connection and API URL."
-                }
+                self._log(f"[API-SIGN] ✓ Server response received")
+                self._log(f"[API-SIGN] ✓ Signature: {result.get('signature', 'MISSING')[:20]}...")
+                self._log(f"[API-SIGN] ✓ Signature version: {result.get('signature_version')}")
                 
-            except Exception as e:
-                self._log(f"[API-SIGN] [BFROS-ERROR] ❌ Unexpected exception during request!")
-                self._log(f"[API-SIGN] [BFROS-ERROR] Exception type: {type(e).__name__}")
-                self._log(f"[API-SIGN] [BFROS-ERROR] Exception message: {str(e)}")
-                import traceback
-                self._log(f"[API-SIGN] [BFROS-ERROR] Traceback:\n{traceback.format_exc()}")
-                return {
-                    'error': f"Signing failed: {str(e)}"
-                }
+                if result.get('github'):
+                    self._log(f"[API-SIGN] ✓ GitHub timestamp: {result['github']['url']}")
+                else:
+                    self._log(f"[API-SIGN] ⚠️  No GitHub timestamp (non-fatal)")
                 
+                self._log(f"[API-SIGN] ========================================")
+                self._log(f"[API-SIGN] REQUEST COMPLETED SUCCESSFULLY")
+                self._log(f"[API-SIGN] ========================================")
+            return result
+            
+        except OSError as e:
+            # Socket-level failures: DNS, refused/reset connections,
+            # timeouts and SSL errors are all OSError subclasses
+            self._log(f"[API-SIGN] [BFROS-ERROR] ❌ URL/Network Error!")
+            self._log(f"[API-SIGN] [BFROS-ERROR] Error type: {type(e).__name__}")
+            self._log(f"[API-SIGN] [BFROS-ERROR] Error reason: {e}")
+            self._log(f"[API-SIGN] [BFROS-ERROR] This usually means:")
+            self._log(f"[API-SIGN] [BFROS-ERROR]   - DNS resolution failed")
+            self._log(f"[API-SIGN] [BFROS-ERROR]   - Server unreachable")
+            self._log(f"[API-SIGN] [BFROS-ERROR]   - Connection timeout")
+            self._log(f"[API-SIGN] [BFROS-ERROR]   - SSL/TLS handshake failed")
+            
+            return {
+                'error': f"Network error: {e}. Check internet connection and API URL."
+            }
+            
         except Exception as e:
-            self._log(f"[API-SIGN] [BFROS-ERROR] ❌ Fatal error in sign_and_timestamp()!")
+            self._log(f"[API-SIGN] [BFROS-ERROR] ❌ Unexpected exception during request!")
             self._log(f"[API-SIGN] [BFROS-ERROR] Exception type: {type(e).__name__}")
             self._log(f"[API-SIGN] [BFROS-ERROR] Exception message: {str(e)}")
-            import traceback
-            self._log(f"[API-SIGN] [BFROS-ERROR] Traceback:\n{traceback.format_exc()}")
+            if self.debug_log:
+                self._log(f"[API-SIGN] [BFROS-ERROR] Traceback:\n{traceback.format_exc()}")
             return {
-                'error': f"Fatal error: {str(e)}"
+                'error': f"Signing failed: {str(e)}"
             }
     
+    def _get_ssl_context(self):
+        """Get the cached SSL context, creating it on first use"""
+        if self._ssl_context is None:
+            self._ssl_context = self._create_ssl_context()
+        return self._ssl_context
+    
+    def _create_ssl_context(self):
+        """
+        Create the SSL context for HTTPS connections to the API server.
+        
+        Multi-strategy (handles Krita's bundled Python): certifi bundle, then
+        the system default context, then an unverified context as a last resort.
+        """
+        self._log(f"[API-SIGN] [BFROS-6] Creating SSL context...")
+        
+        ssl_context = None
+        ssl_strategy_used = None
+        
+        # Try certifi first (best cross-platform solution)
+        try:
+            import certifi
+            certifi_path = certifi.where()
+            if os.path.isfile(certifi_path):
+                self._log(f"[API-SIGN] [BFROS-6a] Trying certifi package...")
+                ssl_context = ssl.create_default_context(cafile=certifi_path)
+                ssl_strategy_used = "certifi"
+                self._log(f"[API-SIGN] [BFROS-6a] ✓ Using certifi: {certifi_path}")
+        except ImportError:
+            self._log(f"[API-SIGN] [BFROS-6a] certifi not available")
+        except Exception as e:
+            self._log(f"[API-SIGN] [BFROS-6a] certifi failed: {e}")
+        
+        # Fallback: Try default system context
+        if not ssl_context:
+            try:
+                self._log(f"[API-SIGN] [BFROS-6b] Trying system default SSL context...")
+                ssl_context = ssl.create_default_context()
+                ssl_strategy_used = "system_default"
+                self._log(f"[API-SIGN] [BFROS-6b] ✓ Using system default context")
+            except Exception as e:
+                self._log(f"[API-SIGN] [BFROS-6b] System default failed: {e}")
+        
+        # Last resort: Unverified context (INSECURE but functional)
+        # Only for development/testing - logs warning
+        if not ssl_context:
+            self._log(f"[API-SIGN] [BFROS-6c] ⚠️  FALLBACK: Creating unverified SSL context")
+            self._log(f"[API-SIGN] [BFROS-6c] ⚠️  This disables certificate verification!")
+            self._log(f"[API-SIGN] [BFROS-6c] ⚠️  Use only for development/testing")
+            ssl_context = ssl._create_unverified_context()
+            ssl_strategy_used = "unverified"
+        
+        self._log(f"[API-SIGN] [BFROS-6] ✓ SSL context created using: {ssl_strategy_used}")
+        return ssl_context
+    
+    def _api_request(self, method, path, body=None, headers=None):
+        """
+        Send a request to the API server over a persistent connection.
+        
+        The connection is kept alive between calls, so repeated signing
+        requests skip the TCP and TLS handshakes. An idle connection the
+        server has already closed is detected and reopened before sending.
+        Proxy settings from the environment are applied as urlopen() would
+        (see http_util.open_connection).
+        If a reused connection turns out to have been closed by the server
+        while the request is being sent, it is reopened and the request is
+        sent once more. Failures after the
+        request went out are never retried, since the server may already have
+        signed the proof and created its gist.
+        
+        Args:
+            method: str - HTTP method
+            path: str - request path (e.g. '/api/sign-and-timestamp')
+            body: bytes - optional request body
+            headers: dict - request headers
+        
+        Returns:
+            tuple: (status code, reason phrase, response body bytes); error
+                bodies (status >= 400) are truncated to MAX_ERROR_BODY_BYTES
+        """
+        while True:
+            if self._conn is not None and self._connection_dropped():
+                self._log(f"[API] Idle connection was closed by the server, reconnecting...")
+                self._close_connection()
+            
+            reused = self._conn is not None
+            if not reused:
+                self._conn, self._proxy_prefix, self._proxy_headers = open_connection(
+                    self._api_scheme, self._api_host, self._api_port, timeout=self.timeout,
+                    context=self._get_ssl_context() if self._api_scheme == 'https' else None
+                )
+            try:
+                self._conn.request(
+                    method, self._proxy_prefix + path, body=body,
+                    headers={**(headers or {}), **self._proxy_headers}
+                )
+            except (ConnectionResetError, BrokenPipeError):
+                self._close_connection()
+                if not reused:
+                    raise
+                self._log(f"[API] Kept-alive connection was closed, reconnecting...")
+                continue
+            except Exception:
+                self._close_connection()
+                raise
+            
+            try:
+                response = self._conn.getresponse()
+                if response.status < 400:
+                    return response.status, response.reason, response.read()
+                
+                body = response.read(MAX_ERROR_BODY_BYTES)
+                if not response.isclosed():
+                    # Rest of the body left unread, so the connection can't be reused
+                    self._close_connection()
+                return response.status, response.reason, body
+            except Exception:
+                self._close_connection()
+                raise
+    
+    def _connection_dropped(self):
+        """
+        Check whether the idle kept-alive connection was closed by the server.
+        
+        An idle socket should have nothing to read; if it polls readable, the
+        server has sent EOF (or unexpected data) and the socket can't be reused.
+        """
+        sock = self._conn.sock
+        if sock is None:
+            # Closed after a 'Connection: close' response; http.client
+            # reopens it by itself on the next request
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+    
+    def _close_connection(self):
+        """Close the persistent API connection (reopened on next request)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def submit_proof(self, proof_dict):
         """
         Submit proof to CHM backend/database.
@@ -252,7 +394,8 @@ class CHMApiClient:
         try:
             self._log(f"[API] Submitting proof: {proof_dict.get('session_id', 'unknown')}")
             
-            # Add submission timestamp
+            # Add submission timestamp (shallow copy: nested event data is
+            # shared with proof_dict, not duplicated)
             submission_record = {
                 **proof_dict,
                 'submitted_at': datetime.utcnow().isoformat() + 'Z',
@@ -286,8 +429,10 @@ class CHMApiClient:
         """
         try:
             # Append to JSONL file (newline-delimited JSON)
-            with open(self.proofs_file, 'a') as f:
-                f.write(json.dumps(proof_record) + '\n')
+            with open(self.proofs_file, 'ab') as f:
+                f.write(_json_dumps_bytes(proof_record) + b'\n')
+            if self._total_proofs is not None:
+                self._total_proofs += 1
             
             # Update file hash index for duplicate detection
             self._update_hash_index(proof_record)
@@ -334,13 +479,7 @@ class CHMApiClient:
             dict or None: Existing proof record if found, None otherwise
         """
         try:
-            if not os.path.exists(self.duplicates_index):
-                return None
-            
-            with open(self.duplicates_index, 'r') as f:
-                index = json.load(f)
-            
-            existing = index.get(file_hash)
+            existing = self._get_hash_index().get(file_hash)
             
             if existing:
                 self._log(f"[API] ⚠️  Duplicate detected: {file_hash[:16]}...")
@@ -353,6 +492,72 @@ class CHMApiClient:
             self._log(f"[API] Duplicate check failed: {e}")
             return None
     
+    def _get_hash_index(self):
+        """
+        Return the file hash index, reading it from disk only on first use.
+        
+        The index is rebuilt from the JSON snapshot (if present) plus the
+        append-only log, where later lines win. A non-empty log is then folded
+        into the snapshot (see flush_index), so each plugin session starts
+        with a short log. This client is the only writer, so later lookups
+        use the in-memory dict and _update_hash_index() keeps it current.
+        
+        Returns:
+            dict: file_hash -> proof summary
+        """
+        if self._hash_index is None:
+            try:
+                with open(self.duplicates_index, 'r') as f:
+                    index = json.load(f)
+            except FileNotFoundError:
+                index = {}
+            
+            log_lines = 0
+            try:
+                with open(self.duplicates_log, 'r') as f:
+                    line = ''
+                    for log_lines, line in enumerate(f, 1):
+                        try:
+                            index.update(json.loads(line))
+                        except ValueError:
+                            # Torn last line from an interrupted write
+                            self._log(f"[API] Skipping unreadable index log line")
+                    # Start the next append on a fresh line if the log ends mid-line
+                    self._hash_log_partial = bool(line) and not line.endswith('\n')
+            except FileNotFoundError:
+                pass
+            
+            self._hash_index = index
+            
+            # Krita gives the plugin no reliable shutdown hook, so the previous
+            # session's log is compacted here instead of on close
+            if log_lines:
+                self.flush_index()
+        return self._hash_index
+    
+    def flush_index(self):
+        """
+        Write the in-memory index as a compact JSON snapshot and empty the log.
+        
+        The snapshot is replaced atomically before the log is truncated; if
+        the process dies in between, replaying the log over the new snapshot
+        gives the same index.
+        """
+        try:
+            index = self._get_hash_index()
+            tmp_file = self.duplicates_index + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps_bytes(index))
+            os.replace(tmp_file, self.duplicates_index)
+            
+            # Every logged entry is in the snapshot now
+            open(self.duplicates_log, 'wb').close()
+            self._hash_log_partial = False
+            
+            self._log(f"[API] Index snapshot written: {len(index)} proofs tracked")
+        except Exception as e:
+            self._log(f"[API] Index snapshot failed: {e}")
+    
     def _update_hash_index(self, proof_record):
         """
         Update file hash index with new proof.
@@ -361,26 +566,25 @@ class CHMApiClient:
             proof_record: dict - proof data
         """
         try:
-            # Load existing index
-            if os.path.exists(self.duplicates_index):
-                with open(self.duplicates_index, 'r') as f:
-                    index = json.load(f)
-            else:
-                index = {}
+            index = self._get_hash_index()
             
             # Add entry for file_hash
             file_hash = proof_record.get('file_hash')
             if file_hash:
-                index[file_hash] = {
+                entry = {
                     'session_id': proof_record['session_id'],
                     'classification': proof_record.get('classification', 'Unknown'),
                     'submitted_at': proof_record['submitted_at'],
                     'perceptual_hash': proof_record.get('perceptual_hash')
                 }
-            
-            # Save updated index
-            with open(self.duplicates_index, 'w') as f:
-                json.dump(index, f, indent=2)
+                index[file_hash] = entry
+                
+                # Append just the new entry instead of rewriting the whole index
+                with open(self.duplicates_log, 'ab') as f:
+                    if self._hash_log_partial:
+                        f.write(b'\n')
+                        self._hash_log_partial = False
+                    f.write(_json_dumps_bytes({file_hash: entry}) + b'\n')
             
             self._log(f"[API] Index updated: {len(index)} proofs tracked")
             
@@ -405,20 +609,19 @@ class CHMApiClient:
                 'classifications': {}
             }
             
-            # Count total proofs
-            if os.path.exists(self.proofs_file):
-                with open(self.proofs_file, 'r') as f:
-                    stats['total_proofs'] = sum(1 for _ in f)
+            # Count total proofs (file is scanned once, then kept up to date
+            # by _submit_to_file)
+            if self._total_proofs is None:
+                self._total_proofs = self._count_lines(self.proofs_file)
+            stats['total_proofs'] = self._total_proofs
             
-            # Count unique artworks and classifications
-            if os.path.exists(self.duplicates_index):
-                with open(self.duplicates_index, 'r') as f:
-                    index = json.load(f)
-                    stats['unique_artworks'] = len(index)
-                    
-                    for entry in index.values():
-                        cls = entry.get('classification', 'Unknown')
-                        stats['classifications'][cls] = stats['classifications'].get(cls, 0) + 1
+            # Count unique artworks and classifications from the in-memory index
+            index = self._get_hash_index()
+            stats['unique_artworks'] = len(index)
+            
+            for entry in index.values():
+                cls = entry.get('classification', 'Unknown')
+                stats['classifications'][cls] = stats['classifications'].get(cls, 0) + 1
             
             return stats
             
@@ -426,16 +629,30 @@ class CHMApiClient:
             self._log(f"[API] Stats failed: {e}")
             return {'error': str(e)}
     
+    @staticmethod
+    def _count_lines(path, chunk_size=65536):
+        """
+        Count lines in a file by counting newlines in binary chunks.
+        
+        A final line without a trailing newline still counts. A missing
+        file has no lines.
+        """
+        count = 0
+        chunk = b''
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(chunk_size), b''):
+                    count += chunk.count(b'\n')
+        except FileNotFoundError:
+            return 0
+        if chunk and not chunk.endswith(b'\n'):
+            count += 1
+        return count
+    
     def _log(self, message):
         """Log debug message to file if enabled"""
         if self.debug_log:
-            # Import debug_log from __init__.py to write to file
-            try:
-                from . import debug_log
-                debug_log(message)
-            except ImportError:
-                # Fallback to print if debug_log not available
-                print(message)
+            _debug_log(message)
 
 
 if __name__ == "__main__":
@@ -247,6 +247,77 @@ def _verify_ed25519_signature(proof_data: Dict[str, Any], signature_b64: str) ->
         return False
 
 
+def sha256_file(path: str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file without loading it into memory.
+    
+    Uses hashlib.file_digest (Python 3.11+), which hashes in C-level chunks;
+    older Pythons (e.g. Krita's bundled 3.10) fall back to readinto() over a
+    reusable buffer.
+    
+    Args:
+        path: Path to the file to hash
+        
+    Returns:
+        str: Hex-encoded SHA-256 digest
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        h = hashlib.sha256()
+        buf = memoryview(bytearray(1 << 20))
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(buf[:n])
+        return h.hexdigest()
+
+
+def block_hash(path: str, blocks: int = 16, block_size: int = 65536) -> str:
+    """
+    Compute a sampled SHA-256 over fixed-size blocks of a file.
+    
+    Hashes the file size plus the head block, the tail block and
+    (blocks - 2) equally spaced blocks in between, each prefixed with its
+    offset. Cost is O(blocks * block_size) regardless of file length, so it
+    works as a quick pre-check before the full sha256_file(). Files no larger
+    than blocks * block_size are hashed whole (same size/offset framing).
+    
+    This is NOT a substitute for the full file hash: changes outside the
+    sampled blocks are not detected.
+    
+    Args:
+        path: Path to the file to hash
+        blocks: Number of blocks to sample (minimum 2: head and tail)
+        block_size: Size of each block in bytes
+        
+    Returns:
+        str: Hex-encoded SHA-256 digest of the sampled blocks
+    """
+    import os
+    import struct
+    
+    blocks = max(blocks, 2)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        h = hashlib.sha256(struct.pack('>Q', size))
+        
+        if size <= blocks * block_size:
+            offsets = range(0, size, block_size)
+        else:
+            last = size - block_size
+            offsets = [last * i // (blocks - 1) for i in range(blocks)]
+        
+        for offset in offsets:
+            f.seek(offset)
+            h.update(struct.pack('>Q', offset))
+            h.update(f.read(block_size))
+        
+        return h.hexdigest()
+
+
 class CHMProof:
     """
     Proof object wrapper for session verification data.
@@ -313,6 +384,13 @@ class CHMSession:
     a timestamped proof of human-made artwork.
     """
     
+    # Fixed attribute layout: faster attribute access on the per-stroke path.
+    # _cached_classification is only set on export snapshots (checked via hasattr)
+    __slots__ = (
+        'id', 'session_id', 'document_id', 'start_time', 'events', 'metadata',
+        'finalized', '_drawing_time_secs', '_layer_count', '_cached_classification',
+    )
+    
     def __init__(self, document_id: Optional[str] = None):
         """
         Create a new session for a document.
@@ -389,6 +467,29 @@ class CHMSession:
         }
         self.events.append(event)
     
+    def record_strokes(self, strokes):
+        """
+        Record a batch of brush stroke events (compatibility with Rust API).
+        
+        Args:
+            strokes: Iterable of (x, y, pressure, brush_name) tuples
+        """
+        if self.finalized:
+            raise RuntimeError("Cannot record events on finalized session")
+        
+        timestamp = datetime.utcnow().timestamp()
+        self.events.extend(
+            {
+                "type": "stroke",
+                "x": x,
+                "y": y,
+                "pressure": pressure,
+                "brush_name": brush_name,
+                "timestamp": timestamp
+            }
+            for x, y, pressure, brush_name in strokes
+        )
+    
     def record_layer_created(self, layer_name: str, timestamp: float):
         """
         Record a layer creation event.
@@ -466,6 +567,18 @@ class CHMSession:
         duration = (datetime.utcnow() - self.start_time).total_seconds()
         return int(duration)
     
+    def status(self):
+        """
+        Get a snapshot of session counters in one call (compatibility with Rust API).
+        
+        Returns:
+            Tuple of (event_count, duration_secs, last_event_timestamp)
+        """
+        last_timestamp = self.events[-1].get("timestamp") if self.events else None
+        if last_timestamp is None:
+            last_timestamp = self.start_time.timestamp()
+        return len(self.events), self.duration_secs, int(last_timestamp)
+    
     @property
     def drawing_time_secs(self) -> int:
         """
@@ -601,6 +714,7 @@ class CHMSession:
         
         # File hash computation if artwork path provided
         file_hash = None
+        file_block_hash = None
         
         if artwork_path and os.path.exists(artwork_path):
             print(f"[FLOW-3c-HASH] 🖼️ Computing file hash for: {artwork_path}")
@@ -608,11 +722,13 @@ class CHMSession:
             
             try:
                 # File hash (SHA-256 of exact bytes) - sufficient for duplicate detection
-                with open(artwork_path, 'rb') as f:
-                    artwork_bytes = f.read()
-                    file_hash = hashlib.sha256(artwork_bytes).hexdigest()
-                    print(f"[FLOW-3c-HASH] ✓ File hash (SHA-256): {file_hash[:16]}...")
-                    safe_flush()
+                file_hash = sha256_file(artwork_path)
+                print(f"[FLOW-3c-HASH] ✓ File hash (SHA-256): {file_hash[:16]}...")
+                
+                # Sampled block hash - lets verifiers reject obvious mismatches without reading the whole file
+                file_block_hash = block_hash(artwork_path)
+                print(f"[FLOW-3c-HASH] ✓ Block hash (sampled SHA-256): {file_block_hash[:16]}...")
+                safe_flush()
                     
             except Exception as e:
                 print(f"[FLOW-3c-HASH] ⚠️ Failed to compute file hash: {e}")
@@ -652,6 +768,7 @@ class CHMSession:
             },
             "events_hash": events_hash,
             "file_hash": file_hash if file_hash else "placeholder_no_artwork_provided",
+            "file_block_hash": file_block_hash,
             "classification": classification,
             "import_count": import_count,  # Track as separate metric (not part of classification)
             "metadata": self.metadata
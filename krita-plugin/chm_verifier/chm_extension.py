@@ -748,7 +748,7 @@ class CHMExtension(Extension):
                         self._log(f"[C2PA] ✅ Using test certificates for signing")
                     
                     manifest = self.c2pa_builder.generate_manifest(
-                        session_proof_json=json.dumps(proof_dict),
+                        session_proof_dict=proof_dict,
                         cert_path=cert_path,
                         key_path=key_path,
                         privacy_mode="lite"  # Aggregate data only (privacy-preserving)
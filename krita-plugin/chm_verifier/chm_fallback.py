@@ -222,9 +222,12 @@ class CHMSession:
             if os.path.exists(artwork_path):
                 try:
                     # File hash (SHA-256 of exact bytes) - sufficient for duplicate detection
-                    with open(artwork_path, 'rb') as f:
-                        artwork_bytes = f.read()
-                        file_hash = hashlib.sha256(artwork_bytes).hexdigest()
+                    # Streamed in 64 KiB chunks so large exports are never fully resident
+                    h = hashlib.sha256()
+                    with open(artwork_path, 'rb', buffering=0) as f:
+                        for chunk in iter(lambda: f.read(1 << 16), b''):
+                            h.update(chunk)
+                    file_hash = h.hexdigest()
                         
                 except Exception as e:
                     print(f"[CHM-FALLBACK] Warning: Failed to compute file hash: {e}")
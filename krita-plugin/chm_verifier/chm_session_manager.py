@@ -8,6 +8,7 @@ Handles session lifecycle (create, update, finalize, resume).
 from .chm_loader import chm
 import json
 import uuid
+import weakref
 
 # Import safe_flush utility for Windows compatibility
 try:
@@ -26,9 +27,14 @@ except ImportError:
 class CHMSessionManager:
     """Manages CHM sessions for multiple documents"""
     
+    __slots__ = ('active_sessions', 'DEBUG_LOG', '_doc_uuid_cache')
+    
     def __init__(self, debug_log=True):
         self.active_sessions = {}  # Map: stable_doc_key -> CHMSession
         self.DEBUG_LOG = debug_log
+        # Map: id(document wrapper) -> (weakref to wrapper, document UUID)
+        # Saves re-reading the UUID annotation on every event for the same wrapper
+        self._doc_uuid_cache = {}
     
     def _ensure_document_uuid(self, document):
         """
@@ -44,6 +50,13 @@ class CHMSessionManager:
         Returns:
             str: Document UUID (existing or newly generated)
         """
+        # The UUID never changes for a document, so it is read from the
+        # annotation once per wrapper object (identity-checked via weakref,
+        # so a recycled id() never returns another document's UUID)
+        cached = self._doc_uuid_cache.get(id(document))
+        if cached is not None and cached[0]() is document:
+            return cached[1]
+        
         try:
             if self.DEBUG_LOG:
                 self._log(f"[UUID-CHECK] Checking UUID for document: {document.name()}")
@@ -75,6 +88,7 @@ class CHMSessionManager:
                     self._log(f"[UUID] ✓ Found existing UUID: {uuid_snippet}")
                 
                 self._log(f"[BFROS-CHECKPOINT-F] ✅ ANNOTATION READ SUCCESS: UUID exists")
+                self._cache_document_uuid(document, existing_uuid)
                 return existing_uuid
             
             # No UUID found, generate new one
@@ -134,6 +148,9 @@ class CHMSessionManager:
                 self._log(f"[BFROS-CHECKPOINT-F] ❌ ANNOTATION NOT PERSISTED (read back None/empty)")
                 self._log(f"[BFROS-CHECKPOINT-F] → This could be the Windows bug! Annotations may not work on Windows.")
             
+            # Cached even if the annotation didn't persist, so this wrapper
+            # keeps one UUID instead of minting a new one per call
+            self._cache_document_uuid(document, new_uuid)
             return new_uuid
             
         except Exception as e:
@@ -183,6 +200,23 @@ class CHMSessionManager:
             self._log(f"[DOC-KEY] ⚠️ Using fallback id() key: {fallback_key}")
         return fallback_key
         
+    def _cache_document_uuid(self, document, doc_uuid):
+        """
+        Remember the UUID for a document wrapper until the wrapper is destroyed.
+        
+        Args:
+            document: Krita document
+            doc_uuid: UUID returned by _ensure_document_uuid()
+        """
+        doc_id = id(document)
+        cache = self._doc_uuid_cache
+        try:
+            ref = weakref.ref(document, lambda _ref: cache.pop(doc_id, None))
+        except TypeError:
+            # Wrapper type doesn't support weak references - don't cache
+            return
+        cache[doc_id] = (ref, doc_uuid)
+    
     def create_session(self, document, session_id=None, ai_plugins=None, ai_plugins_detected=False):
         """
         Create a new session for a document.
@@ -28,14 +28,14 @@ except ImportError:
 
 class UndoRedoHandler(QObject):
     """
-    Detects undo operations using QShortcut (ROAA Approach 3).
+    Detects undo operations via Krita's edit_undo action.
     
-    Uses Qt's built-in shortcut system which is more reliable than event filters
-    since keyboard events are often consumed by focused widgets before reaching
-    the main window event filter.
+    Connects to the action's triggered signal, which fires once per undo
+    however it was invoked (shortcut, Edit menu, toolbar button). Falls back
+    to a QShortcut (ROAA Approach 3) if the action isn't available.
     
     Captures:
-    - Ctrl+Z (Windows/Linux) / Cmd+Z (Mac) → Undo
+    - edit_undo action / Ctrl+Z (Windows/Linux) / Cmd+Z (Mac) → Undo
     
     Note: We only track undos (not redos) as they are a stronger indicator
     of human creative process (trial and error, refinement).
@@ -47,6 +47,7 @@ class UndoRedoHandler(QObject):
         self.event_capture = event_capture  # For accessing _log method
         self.DEBUG_LOG = debug_log
         self.shortcuts_installed = False
+        self.undo_action = None
         self.undo_shortcut = None
         
         self._log(f"[UndoHandler-INIT] UndoRedoHandler created with DEBUG_LOG={self.DEBUG_LOG}")
@@ -66,11 +67,23 @@ class UndoRedoHandler(QObject):
             safe_flush()
     
     def _install_shortcuts(self, main_window):
-        """Install QShortcut for Cmd+Z / Ctrl+Z"""
+        """Connect to the edit_undo action, or install a Cmd+Z / Ctrl+Z QShortcut"""
         if self.shortcuts_installed:
             return
         
         try:
+            # The action's triggered signal only fires on an actual undo and
+            # also covers the menu/toolbar, which a key shortcut can't see
+            undo_action = Krita.instance().action('edit_undo')
+            if undo_action is not None:
+                undo_action.triggered.connect(self._on_undo)
+                self.undo_action = undo_action
+                self.shortcuts_installed = True
+                self._log("[UndoHandler] ✓ Connected to edit_undo action")
+                return
+            
+            self._log("[UndoHandler] edit_undo action not found - falling back to QShortcut")
+            
             # QShortcut automatically handles Cmd (Mac) vs Ctrl (Win/Linux)
             self.undo_shortcut = QShortcut(QKeySequence.Undo, main_window)
             self.undo_shortcut.activated.connect(self._on_undo)
@@ -84,7 +97,7 @@ class UndoRedoHandler(QObject):
             self._log(f"[UndoHandler] Traceback: {traceback.format_exc()}")
     
     def _on_undo(self):
-        """Handle undo operation (called by QShortcut)"""
+        """Handle undo operation (called by edit_undo action or QShortcut)"""
         app = Krita.instance()
         doc = app.activeDocument()
         
@@ -223,6 +236,22 @@ class CanvasEventFilter(QObject):
 class EventCapture:
     """Captures and records Krita events to CHM sessions"""
     
+    # Fixed attribute layout for the poll/stroke hot path. __weakref__ is kept
+    # because bound methods are connected to Qt signals and timers.
+    # _poll_count, _mod_poll_count and _layer_debug_count are created lazily.
+    __slots__ = (
+        'session_manager', 'session_storage', 'plugin_monitor', 'DEBUG_LOG',
+        'connected_views', 'connected_documents', 'layer_cache', 'current_brush_name',
+        'canvas_event_filter', 'canvas_filter_installed',
+        'undo_redo_handler', 'undo_handler_installed', 'poll_timer',
+        'doc_modified_state', 'doc_content_hash', '_last_stroke_time', 'doc_undo_count',
+        'polls_without_change', 'AFK_POLL_THRESHOLD', 'active_poll_count',
+        'import_tracker', 'pending_import_checks', 'IMPORT_CHECK_DELAY', 'scanned_documents',
+        'stroke_in_progress', 'stroke_start_time',
+        '_poll_count', '_mod_poll_count', '_layer_debug_count',
+        '__weakref__',
+    )
+    
     def __init__(self, session_manager, session_storage=None, plugin_monitor=None, debug_log=True):
         self.session_manager = session_manager
         self.session_storage = session_storage  # For persisting sessions
@@ -791,10 +820,11 @@ class EventCapture:
     
     def _install_undo_handler(self):
         """
-        Install QShortcut-based undo handler on main window.
+        Install the undo handler once a main window exists.
         
-        Uses Qt's native QShortcut which is more reliable than event filters
-        since keyboard events are consumed by focused widgets.
+        Connects to Krita's edit_undo action (QShortcut fallback), which is
+        more reliable than event filters since keyboard events are consumed
+        by focused widgets.
         """
         if self.undo_handler_installed:
             return True  # Already installed
@@ -830,7 +860,7 @@ class EventCapture:
             
             if self.DEBUG_LOG:
                 self._log("[UndoHandler-Install] ✓ Undo handler installed on main window")
-                self._log("[UndoHandler-Install]   → QShortcut will detect Ctrl/Cmd+Z")
+                self._log("[UndoHandler-Install]   → edit_undo action / QShortcut will detect undo")
             
             return True
             
@@ -0,0 +1,95 @@
+"""
+File Hash Cache - Skip rehashing files that have not changed
+
+Maps a file path to its SHA-256 digest, keyed on the file's stat fields
+(mtime_ns, size, inode). A lookup costs one os.stat(); the file is only
+re-read when any of those fields change.
+
+Each cache file gets its own table, loaded on first use and written back
+with only its own entries, so callers hashing the same fixtures across runs
+(debug scripts, CI) skip hashing entirely on warm runs. Calls without a
+cache file share one in-memory table. Every table is capped at MAX_ENTRIES,
+dropping the least recently used path first.
+
+Proof generation hashes the exported artwork with chm_core.sha256_file()
+directly: the digest is signed, so it must always come from the file's
+current bytes.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from .chm_core import sha256_file
+
+MAX_ENTRIES = 1024
+
+# cache file (None = in-memory only) -> {path: [mtime_ns, size, ino, hex digest]},
+# each table kept in least- to most-recently-used order
+_caches: Dict[Optional[str], Dict[str, List]] = {}
+
+
+def _load_cache_file(cache_file: str) -> Dict[str, List]:
+    """Read a persisted cache file into a new table"""
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        # Missing or corrupt cache just means a cold start
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # Keep the most recently used entries if the file outgrew the cap
+    return dict(list(cache.items())[-MAX_ENTRIES:])
+
+
+def _save_cache_file(cache_file: str, cache: Dict[str, List]) -> None:
+    """Write a cache file's table to disk (atomically via rename)"""
+    tmp_file = cache_file + ".tmp"
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"[HASH-CACHE] ⚠️ Failed to save cache {cache_file}: {e}")
+
+
+def file_sha256_cached(path: str, cache_file: Optional[str] = None) -> str:
+    """
+    Return the SHA-256 hex digest of a file, reusing a cached digest when
+    the file's (mtime_ns, size, inode) are unchanged.
+
+    Args:
+        path: Path to the file to hash
+        cache_file: Optional JSON file to persist the cache across runs
+
+    Returns:
+        str: Hex-encoded SHA-256 digest
+
+    Raises:
+        OSError: If the file cannot be stat'd or read
+    """
+    path = os.path.abspath(path)
+
+    cache_file = cache_file or None
+    cache = _caches.get(cache_file)
+    if cache is None:
+        cache = _caches[cache_file] = _load_cache_file(cache_file) if cache_file else {}
+
+    st = os.stat(path)
+    key = [st.st_mtime_ns, st.st_size, st.st_ino]
+
+    entry = cache.pop(path, None)
+    if entry and entry[:3] == key:
+        cache[path] = entry
+        return entry[3]
+
+    digest = sha256_file(path)
+    cache[path] = key + [digest]
+    if len(cache) > MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+    if cache_file:
+        _save_cache_file(cache_file, cache)
+
+    return digest
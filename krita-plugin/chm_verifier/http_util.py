@@ -0,0 +1,79 @@
+"""
+HTTP connection helpers shared by the API client and timestamp service.
+
+Both keep a persistent http.client connection instead of using urlopen(),
+so they have to apply the user's proxy settings (HTTPS_PROXY / HTTP_PROXY /
+NO_PROXY, or the OS proxy config on Windows/macOS) themselves.
+"""
+
+import base64
+import http.client
+import urllib.request
+from urllib.parse import urlsplit, unquote
+
+
+def get_proxy(scheme, host):
+    """
+    Look up the proxy configured for a target, the same way urlopen() does.
+
+    Args:
+        scheme: str - 'http' or 'https'
+        host: str - target hostname
+
+    Returns:
+        tuple or None: (proxy_host, proxy_port, headers) where headers holds
+            Proxy-Authorization if the proxy URL has credentials; None if no
+            proxy applies to this host
+    """
+    proxy_url = urllib.request.getproxies().get(scheme)
+    if not proxy_url or urllib.request.proxy_bypass(host):
+        return None
+
+    if '://' not in proxy_url:
+        proxy_url = 'http://' + proxy_url
+    parts = urlsplit(proxy_url)
+
+    headers = {}
+    if parts.username:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+
+    default_port = 443 if parts.scheme == 'https' else 80
+    return parts.hostname, parts.port or default_port, headers
+
+
+def open_connection(scheme, host, port=None, timeout=None, context=None):
+    """
+    Create an HTTP(S) connection to host, through the configured proxy if any.
+
+    HTTPS goes through a CONNECT tunnel, so TLS is still negotiated end to end
+    with the target. Plain HTTP talks to the proxy directly, which needs the
+    absolute URL as the request target and the proxy headers on each request.
+
+    Args:
+        scheme: str - 'http' or 'https'
+        host: str - target hostname
+        port: int - target port (None for the scheme default)
+        timeout: float - socket timeout in seconds
+        context: ssl.SSLContext - TLS context for HTTPS targets
+
+    Returns:
+        tuple: (connection, path_prefix, request_headers) - prepend path_prefix
+            to request paths and add request_headers to each request (both
+            empty unless plain HTTP is going through a proxy)
+    """
+    proxy = get_proxy(scheme, host)
+
+    if scheme == 'https':
+        if proxy is None:
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=context), '', {}
+        proxy_host, proxy_port, proxy_headers = proxy
+        conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=context)
+        conn.set_tunnel(host, port, headers=proxy_headers)
+        return conn, '', {}
+
+    if proxy is None:
+        return http.client.HTTPConnection(host, port, timeout=timeout), '', {}
+    proxy_host, proxy_port, proxy_headers = proxy
+    netloc = f"{host}:{port}" if port else host
+    return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout), f"http://{netloc}", proxy_headers
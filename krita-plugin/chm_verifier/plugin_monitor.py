@@ -17,11 +17,78 @@ This two-tier approach ensures comprehensive detection:
 """
 
 import os
+import re
 import json
+import functools
 import configparser
 from pathlib import Path
 from .logging_util import log_info
 
+# Optional C-level Aho-Corasick automaton (pyahocorasick); Krita's bundled
+# Python usually lacks it, in which case a compiled regex alternation is used
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _build_keyword_matcher(keywords):
+    """
+    Build a single-pass multi-keyword matcher.
+    
+    Args:
+        keywords: Iterable of lowercase keywords
+        
+    Returns:
+        Callable taking a lowercased string and returning the first
+        matching keyword, or None
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        
+        def match(text):
+            for _end_index, keyword in automaton.iter(text):
+                return keyword
+            return None
+        return match
+    
+    # Longest keywords first so overlapping alternatives report the most specific one
+    pattern = re.compile('|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+    
+    def match(text):
+        found = pattern.search(text)
+        return found.group(0) if found else None
+    return match
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_ai_plugin(plugin_lower, registry_names, keyword_matcher):
+    """
+    Two-tier AI plugin match, memoized across scans.
+    
+    Args:
+        plugin_lower: Lowercased plugin name
+        registry_names: Tuple of lowercased registry plugin names
+        keyword_matcher: Matcher built by _build_keyword_matcher
+        
+    Returns:
+        ('registry', name) or ('keyword', keyword) tuple, or None if no match
+    """
+    # Tier 1: Check exact registry match
+    for name in registry_names:
+        if name in plugin_lower:
+            return ('registry', name)
+    
+    # Tier 2: Keyword fallback for variants/new plugins
+    keyword = keyword_matcher(plugin_lower)
+    if keyword is not None:
+        return ('keyword', keyword)
+    
+    return None
+
 
 class PluginMonitor:
     """Monitors and detects installed Krita plugins"""
@@ -61,6 +128,10 @@ class PluginMonitor:
         "defuser", "gan"
     ]
     
+    # Precomputed lookup forms (also used as _match_ai_plugin cache keys)
+    _REGISTRY_NAMES = tuple(p["name"].lower() for p in AI_PLUGINS_REGISTRY)
+    _AI_KEYWORD_MATCHER = staticmethod(_build_keyword_matcher(AI_KEYWORDS))
+    
     def __init__(self, debug_log=True):
         self.DEBUG_LOG = debug_log
         self.detected_plugins = []
@@ -320,23 +391,17 @@ class PluginMonitor:
         Returns:
             True if plugin is known AI plugin, False otherwise
         """
-        plugin_lower = plugin_name.lower()
-        
-        # Tier 1: Check exact registry match
-        for ai_plugin in self.AI_PLUGINS_REGISTRY:
-            if ai_plugin["name"].lower() in plugin_lower:
-                if self.DEBUG_LOG:
-                    self._log(f"[AI-DETECT] ✓ Registry match: {plugin_name} → {ai_plugin['name']}")
-                return True
-        
-        # Tier 2: Keyword fallback for variants/new plugins
-        for keyword in self.AI_KEYWORDS:
-            if keyword in plugin_lower:
-                if self.DEBUG_LOG:
-                    self._log(f"[AI-DETECT] ✓ Keyword match: {plugin_name} → '{keyword}'")
-                return True
-        
-        return False
+        match = _match_ai_plugin(plugin_name.lower(), self._REGISTRY_NAMES, self._AI_KEYWORD_MATCHER)
+        if match is None:
+            return False
+        
+        if self.DEBUG_LOG:
+            tier, matched = match
+            if tier == 'registry':
+                self._log(f"[AI-DETECT] ✓ Registry match: {plugin_name} → {matched}")
+            else:
+                self._log(f"[AI-DETECT] ✓ Keyword match: {plugin_name} → '{matched}'")
+        return True
     
     def get_ai_plugins(self):
         """
@@ -102,99 +102,66 @@ def embed_c2pa_chunk_proper(image_path: str, manifest_bytes: bytes) -> bool:
         
         log_message("[PNG-C2PA-PURE] ✓ Valid PNG signature")
         
-        # Parse PNG chunks
+        # Parse PNG chunk headers (offsets only - chunk data is not copied)
         log_message("[PNG-C2PA-PURE] Parsing PNG chunks...")
-        chunks = []
+        chunk_count = 0
+        idat_offset = None
         offset = 8  # Skip PNG signature
+        png_end = offset
         
-        while offset < len(png_data):
-            # Read chunk length
-            if offset + 4 > len(png_data):
-                break
-            chunk_length = struct.unpack('>I', png_data[offset:offset+4])[0]
-            offset += 4
-            
-            # Read chunk type
-            if offset + 4 > len(png_data):
-                break
-            chunk_type = png_data[offset:offset+4]
-            offset += 4
-            
-            # Read chunk data
-            if offset + chunk_length > len(png_data):
+        while offset + 8 <= len(png_data):
+            # Read chunk length and type
+            chunk_length, chunk_type = struct.unpack_from('>I4s', png_data, offset)
+            chunk_end = offset + 8 + chunk_length + 4  # header + data + CRC
+            if chunk_end > len(png_data):
                 break
-            chunk_data = png_data[offset:offset+chunk_length]
-            offset += chunk_length
             
-            # Read chunk CRC
-            if offset + 4 > len(png_data):
-                break
-            chunk_crc = png_data[offset:offset+4]
-            offset += 4
+            # Remember where the first IDAT chunk starts
+            if chunk_type == b'IDAT' and idat_offset is None:
+                idat_offset = offset
             
-            chunks.append({
-                'type': chunk_type,
-                'data': chunk_data,
-                'crc': chunk_crc
-            })
+            chunk_count += 1
+            offset = png_end = chunk_end
             
             # Stop at IEND chunk
             if chunk_type == b'IEND':
                 break
         
-        log_message(f"[PNG-C2PA-PURE] Parsed {len(chunks)} PNG chunks")
+        log_message(f"[PNG-C2PA-PURE] Parsed {chunk_count} PNG chunks")
         
-        # Create 'caBX' chunk
+        # Create 'caBX' chunk in one preallocated buffer: length + type + data + CRC
         log_message("[PNG-C2PA-PURE] Creating caBX chunk...")
         cabx_type = b'caBX'
-        cabx_data = manifest_bytes
-        cabx_length = len(cabx_data)
+        cabx_length = len(manifest_bytes)
+        cabx_chunk = bytearray(4 + 4 + cabx_length + 4)
+        struct.pack_into('>I4s', cabx_chunk, 0, cabx_length, cabx_type)
+        cabx_chunk[8:8 + cabx_length] = manifest_bytes
         
-        # Calculate CRC-32 (over type + data)
-        crc_input = cabx_type + cabx_data
-        cabx_crc = zlib.crc32(crc_input) & 0xffffffff
+        # Calculate CRC-32 (over type + data) with one zlib call on a view of the buffer
+        cabx_crc = zlib.crc32(memoryview(cabx_chunk)[4:8 + cabx_length]) & 0xffffffff
+        struct.pack_into('>I', cabx_chunk, 8 + cabx_length, cabx_crc)
         
-        cabx_chunk = {
-            'type': cabx_type,
-            'data': cabx_data,
-            'crc': struct.pack('>I', cabx_crc)
-        }
-        
-        log_message(f"[PNG-C2PA-PURE] caBX chunk created: {len(cabx_data)} bytes, CRC: {hex(cabx_crc)}")
+        log_message(f"[PNG-C2PA-PURE] caBX chunk created: {cabx_length} bytes, CRC: {hex(cabx_crc)}")
         
         # Insert 'caBX' chunk before first IDAT chunk
         log_message("[PNG-C2PA-PURE] Finding IDAT chunk for insertion point...")
-        idat_index = None
-        for i, chunk in enumerate(chunks):
-            if chunk['type'] == b'IDAT':
-                idat_index = i
-                break
-        
-        if idat_index is None:
+        if idat_offset is None:
             log_message("[PNG-C2PA-PURE] ❌ No IDAT chunk found")
             return False
         
-        chunks.insert(idat_index, cabx_chunk)
-        
-        log_message(f"[PNG-C2PA-PURE] ✓ Inserted caBX chunk before IDAT (index {idat_index})")
-        
-        # Reconstruct PNG
-        log_message("[PNG-C2PA-PURE] Reconstructing PNG with embedded caBX chunk...")
-        new_png_data = PNG_SIGNATURE
-        
-        for chunk in chunks:
-            chunk_length = len(chunk['data'])
-            new_png_data += struct.pack('>I', chunk_length)
-            new_png_data += chunk['type']
-            new_png_data += chunk['data']
-            new_png_data += chunk['crc']
+        log_message(f"[PNG-C2PA-PURE] ✓ Inserting caBX chunk before IDAT (offset {idat_offset})")
         
-        log_message(f"[PNG-C2PA-PURE] New PNG size: {len(new_png_data)} bytes (was {len(png_data)})")
+        # Write modified PNG as three slices of the original around the new chunk,
+        # instead of rebuilding the whole file through repeated bytes concatenation
+        new_size = png_end + len(cabx_chunk)
+        log_message(f"[PNG-C2PA-PURE] New PNG size: {new_size} bytes (was {len(png_data)})")
         
-        # Write modified PNG
         log_message(f"[PNG-C2PA-PURE] Writing modified PNG to {image_path}...")
+        png_view = memoryview(png_data)
         with open(image_path, 'wb') as f:
-            f.write(new_png_data)
+            f.write(png_view[:idat_offset])
+            f.write(cabx_chunk)
+            f.write(png_view[idat_offset:png_end])
         
         log_message("[PNG-C2PA-PURE] ✅ C2PA manifest embedded successfully!")
         log_message("[PNG-C2PA-PURE] ✅ Used spec-compliant caBX chunk (no Pillow required)")
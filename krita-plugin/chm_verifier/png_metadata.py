@@ -10,16 +10,21 @@ Metadata Fields:
 - CHM-Proof-Hash: SHA-256 hash of proof (for integrity check)
 - CHM-Classification: human-made, ai-assisted, or mixed-media
 
-Implementation uses bundled PIL (Pillow) from vendor/ directory.
+Embedding splices tEXt chunks into the existing PNG byte stream (stdlib only).
+Extraction uses bundled PIL (Pillow) from vendor/ directory.
 """
 
 import os
+import struct
 import sys
+import zlib
 from typing import Dict, Optional
 
 # Debug logging flag
 DEBUG_LOG = True
 
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
 
 def _debug_log(message: str) -> None:
     """Print debug message if DEBUG_LOG is enabled"""
@@ -63,44 +68,50 @@ def add_chm_metadata(
     if not gist_url or not proof_hash or not classification:
         raise ValueError("gist_url, proof_hash, and classification are required")
     
+    metadata_fields = {
+        "CHM-Gist-URL": gist_url,
+        "CHM-Proof-Hash": proof_hash,
+        "CHM-Classification": classification,
+    }
+    
+    # Optional fields
+    if session_id:
+        metadata_fields["CHM-Session-ID"] = session_id
+    
+    # Add plugin version marker
+    metadata_fields["CHM-Version"] = "1.0.0"
+    
     try:
-        # Import PIL from vendor directory
-        from PIL import Image
-        from PIL.PngImagePlugin import PngInfo
-        
-        _debug_log(f"Opening PNG file: {png_path}")
-        
-        # Open the PNG file
-        img = Image.open(png_path)
+        with open(png_path, 'rb') as f:
+            png_data = f.read()
         
         # Verify it's actually a PNG
-        if img.format != 'PNG':
-            raise ValueError(f"File is not a PNG (format: {img.format})")
-        
-        # Create metadata structure
-        metadata = PngInfo()
-        
-        # Add CHM metadata fields
-        metadata.add_text("CHM-Gist-URL", gist_url)
-        metadata.add_text("CHM-Proof-Hash", proof_hash)
-        metadata.add_text("CHM-Classification", classification)
-        
-        # Optional fields
-        if session_id:
-            metadata.add_text("CHM-Session-ID", session_id)
-        
-        # Add plugin version marker
-        metadata.add_text("CHM-Version", "1.0.0")
+        if not png_data.startswith(PNG_SIGNATURE):
+            raise ValueError("File is not a PNG (bad signature)")
         
         _debug_log(f"Metadata prepared:")
         _debug_log(f"  - Gist URL: {gist_url}")
         _debug_log(f"  - Proof Hash: {proof_hash[:16]}...")
         _debug_log(f"  - Classification: {classification}")
         
-        # Save PNG with embedded metadata
-        # Note: This overwrites the original file
-        img.save(png_path, "PNG", pnginfo=metadata)
+        # Splice tEXt chunks in front of IEND instead of re-saving through PIL,
+        # so the image data is copied as-is (no IDAT decode/re-encode).
+        # Existing CHM-* tEXt chunks are dropped so re-embedding replaces them.
+        new_chunks = b"".join(
+            _build_text_chunk(key, value) for key, value in metadata_fields.items()
+        )
+        
+        view = memoryview(png_data)
+        with open(png_path, 'wb') as f:
+            f.write(view[:8])
+            for chunk_type, start, end in _iter_chunks(png_data):
+                if chunk_type == b'IEND':
+                    f.write(new_chunks)
+                elif chunk_type == b'tEXt' and png_data.startswith(b'CHM-', start + 8):
+                    continue
+                f.write(view[start:end])
         
+        # Note: This overwrites the original file
         _debug_log(f"✓ CHM metadata successfully embedded in PNG")
         
         # Verify metadata was written (sanity check)
@@ -108,13 +119,6 @@ def add_chm_metadata(
         
         return True
         
-    except ImportError as e:
-        _debug_log(f"❌ Failed to import PIL: {e}")
-        print(f"CHM: ERROR - PIL not available. Cannot embed metadata.")
-        import traceback
-        print(f"CHM: Import error traceback: {traceback.format_exc()}")
-        return False
-        
     except Exception as e:
         _debug_log(f"❌ Error adding metadata: {e}")
         print(f"CHM: ERROR - Failed to add metadata to PNG: {e}")
@@ -123,6 +127,40 @@ def add_chm_metadata(
         return False
 
 
+def _iter_chunks(png_data: bytes):
+    """
+    Walk the chunk records of a PNG byte string.
+    
+    Yields (chunk_type, start, end) where [start:end] covers the whole
+    length + type + data + CRC record. Stops after IEND.
+    
+    Raises:
+        ValueError: If the chunk stream is truncated or has no IEND
+    """
+    offset = 8  # Skip PNG signature
+    while offset + 12 <= len(png_data):
+        length, chunk_type = struct.unpack_from('>I4s', png_data, offset)
+        end = offset + 12 + length
+        if end > len(png_data):
+            break
+        yield chunk_type, offset, end
+        if chunk_type == b'IEND':
+            return
+        offset = end
+    raise ValueError("Truncated PNG (no IEND chunk)")
+
+
+def _build_text_chunk(keyword: str, text: str) -> bytes:
+    """Build a complete tEXt chunk record (length + type + data + CRC)"""
+    data = keyword.encode('latin-1') + b'\x00' + text.encode('latin-1')
+    return (
+        struct.pack('>I', len(data))
+        + b'tEXt'
+        + data
+        + struct.pack('>I', zlib.crc32(data, zlib.crc32(b'tEXt')))
+    )
+
+
 def _verify_metadata_written(png_path: str, expected_gist_url: str) -> None:
     """
     Verify that metadata was actually written to the PNG file.
@@ -47,6 +47,8 @@ class SessionStorage:
             storage_dir = os.path.expanduser("~/.local/share/chm/sessions")
         
         self.storage_dir = os.path.expanduser(storage_dir)
+        # "<storage_dir>/" - session paths are built by appending "<id>.json"
+        self._path_prefix = os.path.join(self.storage_dir, "")
         self.DEBUG_LOG = debug_log
         
         # Create storage directory if it doesn't exist
@@ -100,17 +102,17 @@ class SessionStorage:
         try:
             filepath = self._get_session_filepath(session_id)
             
-            if not os.path.exists(filepath):
+            # Read session data (open() doubles as the existence check)
+            try:
+                with open(filepath, 'r') as f:
+                    session_json = f.read()
+                    file_size = os.fstat(f.fileno()).st_size
+            except FileNotFoundError:
                 if self.DEBUG_LOG:
                     self._log(f"[PERSIST] Session file not found: {session_id}")
                 return None
             
-            # Read session data
-            with open(filepath, 'r') as f:
-                session_json = f.read()
-            
             if self.DEBUG_LOG:
-                file_size = os.path.getsize(filepath)
                 self._log(f"[PERSIST] ✓ Session loaded: {session_id} ({file_size} bytes)")
             
             return session_json
@@ -134,14 +136,15 @@ class SessionStorage:
         try:
             filepath = self._get_session_filepath(session_id)
             
-            if os.path.exists(filepath):
+            try:
                 os.remove(filepath)
-                self._log(f"[PERSIST] ✓ Session deleted: {session_id}")
-                return True
-            else:
+            except FileNotFoundError:
                 if self.DEBUG_LOG:
                     self._log(f"[PERSIST] Session file not found (already deleted?): {session_id}")
                 return False
+            
+            self._log(f"[PERSIST] ✓ Session deleted: {session_id}")
+            return True
                 
         except Exception as e:
             self._log(f"[PERSIST] ❌ Error deleting session {session_id}: {e}")
@@ -168,14 +171,7 @@ class SessionStorage:
             list: List of session IDs (without .json extension)
         """
         try:
-            if not os.path.exists(self.storage_dir):
-                return []
-            
-            # List all .json files
-            files = os.listdir(self.storage_dir)
-            sessions = [f[:-5] for f in files if f.endswith('.json')]
-            
-            return sessions
+            return [entry.name[:-5] for entry in self._scan_session_files()]
             
         except Exception as e:
             self._log(f"[PERSIST] ❌ Error listing sessions: {e}")
@@ -196,11 +192,11 @@ class SessionStorage:
             current_time = datetime.now().timestamp()
             max_age_seconds = max_age_days * 24 * 60 * 60
             
-            for session_id in self.list_sessions():
-                filepath = self._get_session_filepath(session_id)
+            for entry in self._scan_session_files():
+                session_id = entry.name[:-5]
                 
-                # Check file modification time
-                file_mtime = os.path.getmtime(filepath)
+                # Check file modification time (stat cached on the DirEntry)
+                file_mtime = entry.stat().st_mtime
                 age_seconds = current_time - file_mtime
                 
                 if age_seconds > max_age_seconds:
@@ -232,11 +228,11 @@ class SessionStorage:
         try:
             filepath = self._get_session_filepath(session_id)
             
-            if not os.path.exists(filepath):
+            try:
+                stat = os.stat(filepath)
+            except FileNotFoundError:
                 return None
             
-            stat = os.stat(filepath)
-            
             return {
                 'session_id': session_id,
                 'file_size': stat.st_size,
@@ -288,9 +284,22 @@ class SessionStorage:
             self._log(f"[SESSION-KEY] ❌ Error generating key: {e}")
             return None
     
+    def _scan_session_files(self):
+        """
+        List session files in storage with one directory read.
+        
+        Returns:
+            list: os.DirEntry objects for *.json files (empty if no storage dir)
+        """
+        try:
+            with os.scandir(self.storage_dir) as it:
+                return [entry for entry in it if entry.name.endswith('.json')]
+        except FileNotFoundError:
+            return []
+    
     def _get_session_filepath(self, session_id):
         """Get full filepath for a session ID."""
-        return os.path.join(self.storage_dir, f"{session_id}.json")
+        return f"{self._path_prefix}{session_id}.json"
     
     def _log(self, message):
         """Debug logging helper."""
@@ -15,8 +15,57 @@ import json
 import os
 import hashlib
 import hmac
+import select
+import ssl
+import threading
+import time
 from datetime import datetime
 
+from .http_util import open_connection
+
+
+GITHUB_API_HOST = "api.github.com"
+
+# Requests per hour we allow ourselves, kept under GitHub's limits
+# (60/h anonymous, 5000/h authenticated) to leave headroom for other clients
+GITHUB_HOURLY_BUDGET_ANONYMOUS = 50
+GITHUB_HOURLY_BUDGET_AUTHENTICATED = 4500
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Holds up to `capacity` tokens and refills continuously at
+    capacity / period tokens per second.
+    """
+    
+    def __init__(self, capacity, period=3600.0):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def try_acquire(self):
+        """Take one token if available. Returns False if the bucket is empty."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+    
+    def refund(self):
+        """Give back a token for a request that did not count against the quota"""
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
 
 class TripleTimestampService:
     """
@@ -67,6 +116,19 @@ class TripleTimestampService:
         # Secret key for log signatures (MVP: simple HMAC)
         self.log_secret = self._get_or_create_secret()
         
+        # Created lazily and reused for every request made by this service, so
+        # repeat submissions skip the cert bundle load and the TCP/TLS handshake
+        self._ssl_context = None
+        self._verify_ssl_context = None
+        self._github_conn = None
+        
+        # Gist lookups: ETag cache on disk + client-side request budget
+        self.gist_cache_file = os.path.join(self.data_dir, "gist_cache.json")
+        self._gist_cache = None
+        self._github_bucket = TokenBucket(
+            GITHUB_HOURLY_BUDGET_AUTHENTICATED if self.github_token else GITHUB_HOURLY_BUDGET_ANONYMOUS
+        )
+        
         self._log(f"[TIMESTAMP-INIT] Timestamp Service initialized (GitHub={self.enable_github}, "
                   f"Wayback={self.enable_wayback}, CHM Log={self.enable_chm_log})")
         self._log("[TIMESTAMP-INIT] === Initialization complete ===")
@@ -153,6 +215,23 @@ class TripleTimestampService:
         
         return results
     
+    def submit_proof_hash_bytes(self, digest, proof_dict=None):
+        """
+        Submit a raw SHA-256 digest to all enabled timestamp services.
+        
+        Same as submit_proof_hash(), for callers that hold the 32-byte digest;
+        it is hex-encoded once here, at the boundary where the gist body and
+        log entries need ASCII.
+        
+        Args:
+            digest: bytes - raw SHA-256 digest of proof JSON
+            proof_dict: dict - optional proof data for context
+        
+        Returns:
+            dict: see submit_proof_hash()
+        """
+        return self.submit_proof_hash(digest.hex(), proof_dict)
+    
     def _submit_to_github(self, proof_hash, proof_dict=None):
         """
         Submit proof hash to GitHub Gist.
@@ -160,7 +239,8 @@ class TripleTimestampService:
         Creates a public gist with the proof hash. Git commit timestamp
         provides immutable proof-of-existence.
         
-        Uses stdlib urllib (no external dependencies like requests).
+        Uses a persistent stdlib http.client connection (no external dependencies
+        like requests).
         
         Args:
             proof_hash: str - hash to timestamp
@@ -176,101 +256,9 @@ class TripleTimestampService:
         """
         self._log("[GITHUB-SUBMIT] === Starting GitHub Gist submission ===")
         
-        # Use stdlib urllib instead of requests (Krita doesn't have requests)
-        try:
-            self._log("[GITHUB-SUBMIT] Importing urllib modules...")
-            import urllib.request
-            import urllib.error
-            import ssl
-            self._log("[GITHUB-SUBMIT] ✓ urllib modules imported")
-        except Exception as e:
-            self._log(f"[GITHUB-SUBMIT] ✗ Failed to import urllib: {e}")
-            raise
-        
-        # Create SSL context (for cross-platform certificate handling)
+        # Shared SSL context (created on first use)
         try:
-            self._log("[GITHUB-SUBMIT] Creating SSL context...")
-            
-            # DIAGNOSTIC: Check for certifi package (Python SSL cert bundle)
-            certifi_available = False
-            certifi_path = None
-            try:
-                import certifi
-                certifi_available = True
-                certifi_path = certifi.where()
-                self._log(f"[SSL-DIAG] certifi package available: {certifi_path}")
-            except ImportError:
-                self._log("[SSL-DIAG] certifi package NOT available")
-            
-            # DIAGNOSTIC: Check system SSL paths
-            import os
-            import platform
-            system_info = platform.system()
-            self._log(f"[SSL-DIAG] Operating system: {system_info}")
-            
-            system_cert_paths = [
-                '/etc/ssl/cert.pem',  # macOS
-                '/etc/ssl/certs/ca-certificates.crt',  # Linux
-                '/etc/pki/tls/certs/ca-bundle.crt',  # RedHat/CentOS
-            ]
-            
-            # Windows certificate paths (system cert store)
-            if system_info == 'Windows':
-                self._log("[SSL-DIAG] Windows detected - will use system cert store")
-            
-            self._log("[SSL-DIAG] Checking system certificate paths:")
-            for cert_path in system_cert_paths:
-                exists = os.path.isfile(cert_path)
-                self._log(f"[SSL-DIAG]   {cert_path}: {'EXISTS' if exists else 'NOT FOUND'}")
-            
-            # Try multiple SSL context creation strategies
-            ssl_context = None
-            ssl_strategy_used = None
-            
-            # Strategy 1: Use certifi if available (best for Windows)
-            if certifi_available and certifi_path and os.path.isfile(certifi_path):
-                self._log("[SSL-STRATEGY-1] Trying certifi package...")
-                try:
-                    ssl_context = ssl.create_default_context(cafile=certifi_path)
-                    ssl_strategy_used = "certifi"
-                    self._log("[SSL-STRATEGY-1] ✓ SSL context created with certifi")
-                except Exception as e:
-                    self._log(f"[SSL-STRATEGY-1] ✗ certifi failed: {e}")
-            
-            # Strategy 2: Use default context (system certs) - works on macOS/Linux
-            if not ssl_context:
-                self._log("[SSL-STRATEGY-2] Trying default system context...")
-                try:
-                    ssl_context = ssl.create_default_context()
-                    ssl_strategy_used = "system_default"
-                    self._log("[SSL-STRATEGY-2] ✓ SSL context created with system certs")
-                except Exception as e:
-                    self._log(f"[SSL-STRATEGY-2] ✗ Default context failed: {e}")
-            
-            # Strategy 3: Windows-specific - load system certs manually
-            if not ssl_context and system_info == 'Windows':
-                self._log("[SSL-STRATEGY-3] Trying Windows cert store import...")
-                try:
-                    ssl_context = ssl.create_default_context()
-                    # On Windows, Python should automatically use the system cert store
-                    # But we'll explicitly set minimum TLS version for compatibility
-                    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-                    ssl_strategy_used = "windows_certstore"
-                    self._log("[SSL-STRATEGY-3] ✓ SSL context with Windows cert store")
-                except Exception as e:
-                    self._log(f"[SSL-STRATEGY-3] ✗ Windows cert store failed: {e}")
-            
-            # Strategy 4: Unverified context (FALLBACK - less secure but functional)
-            if not ssl_context:
-                self._log("[SSL-STRATEGY-4] ⚠️  FALLBACK: Using unverified SSL context")
-                self._log("[SSL-STRATEGY-4] ⚠️  This disables certificate verification")
-                self._log("[SSL-STRATEGY-4] ⚠️  Connection is encrypted but not authenticated")
-                ssl_context = ssl._create_unverified_context()
-                ssl_strategy_used = "unverified"
-                self._log("[SSL-STRATEGY-4] ✓ Unverified SSL context created")
-            
-            self._log(f"[GITHUB-SUBMIT] ✓ SSL context created successfully (strategy: {ssl_strategy_used})")
-            
+            ssl_context = self._get_ssl_context()
         except Exception as e:
             self._log(f"[GITHUB-SUBMIT] ✗ Failed to create SSL context: {e}")
             raise
@@ -328,6 +316,7 @@ class TripleTimestampService:
                 
                 # Hashes (full, not truncated)
                 'file_hash': proof_dict.get('file_hash', 'N/A'),
+                'file_block_hash': proof_dict.get('file_block_hash', 'N/A'),
                 'events_hash': proof_dict.get('events_hash', 'N/A'),
                 
                 # Metadata (without sensitive info)
@@ -335,7 +324,8 @@ class TripleTimestampService:
             }
         
         # GitHub Gist API request
-        url = "https://api.github.com/gists"
+        path = "/gists"
+        url = f"https://{GITHUB_API_HOST}{path}"
         headers = {
             'Accept': 'application/vnd.github.v3+json',
             'Content-Type': 'application/json',
@@ -367,57 +357,56 @@ class TripleTimestampService:
         # Convert to bytes for urllib
         data_bytes = json.dumps(gist_data).encode('utf-8')
         
-        # Create request
-        req = urllib.request.Request(url, data=data_bytes, headers=headers, method='POST')
-        
         self._log(f"[GITHUB] POSTing to {url}...")
         self._log(f"[GITHUB] Using token: {'yes' if self.github_token else 'no (anonymous)'}")
         
         try:
-            with urllib.request.urlopen(req, timeout=10, context=ssl_context) as response:
-                response_data = response.read().decode('utf-8')
-                result = json.loads(response_data)
-                
-                self._log(f"[GITHUB] ✓ Gist created: {result.get('html_url', 'unknown')}")
-                
-                # BUG#009 DEBUG: Log what hash was stored in the gist
-                if proof_dict:
-                    stored_hash = gist_content.get('proof_details', {}).get('file_hash', 'MISSING')
-                    self._log(f"[GITHUB-DEBUG] File hash stored in gist: {stored_hash[:40] if stored_hash != 'MISSING' else 'MISSING'}...")
-                    self._log(f"[GITHUB-DEBUG] Classification: {gist_content.get('proof_details', {}).get('classification', 'MISSING')}")
-                    self._log(f"[GITHUB-DEBUG] Session ID: {gist_content.get('proof_details', {}).get('session_id', 'MISSING')}")
-                
-                return {
-                    'url': result['html_url'],
-                    'commit_sha': result['history'][0]['version'] if result.get('history') else None,
-                    'timestamp': result.get('created_at', gist_content['timestamp']),
-                    'verified': True
-                }
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else 'No error body'
-            self._log(f"[GITHUB] HTTP Error {e.code}: {error_body}")
-            # More descriptive error messages
-            if e.code == 401:
-                raise Exception(f"GitHub authentication failed (code {e.code}). Check API token.")
-            elif e.code == 403:
-                raise Exception(f"GitHub rate limit or permissions issue (code {e.code})")
-            elif e.code == 404:
-                raise Exception(f"GitHub API endpoint not found (code {e.code})")
-            else:
-                raise Exception(f"GitHub API HTTP error {e.code}: {error_body[:100]}")
-        except urllib.error.URLError as e:
-            self._log(f"[GITHUB] URL Error: {e.reason}")
+            status, response_body, _ = self._github_request('POST', path, body=data_bytes, headers=headers)
+        except ssl.SSLError as e:
+            self._log(f"[GITHUB] SSL Error: {e}")
+            raise Exception(f"SSL/TLS error: {str(e)}. Certificate validation may have failed.")
+        except OSError as e:
+            self._log(f"[GITHUB] Connection Error: {e}")
             # More descriptive error for common SSL/network issues
-            error_str = str(e.reason)
+            error_str = str(e)
             if 'certificate' in error_str.lower() or 'ssl' in error_str.lower():
                 raise Exception(f"SSL certificate error: {error_str}. Try installing certifi package.")
             elif 'timed out' in error_str.lower() or 'timeout' in error_str.lower():
                 raise Exception(f"Network timeout connecting to GitHub: {error_str}")
             else:
                 raise Exception(f"GitHub connection failed: {error_str}")
-        except ssl.SSLError as e:
-            self._log(f"[GITHUB] SSL Error: {e}")
-            raise Exception(f"SSL/TLS error: {str(e)}. Certificate validation may have failed.")
+        
+        if status >= 400:
+            error_body = response_body.decode('utf-8', errors='replace') or 'No error body'
+            self._log(f"[GITHUB] HTTP Error {status}: {error_body}")
+            # More descriptive error messages
+            if status == 401:
+                raise Exception(f"GitHub authentication failed (code {status}). Check API token.")
+            elif status == 403:
+                raise Exception(f"GitHub rate limit or permissions issue (code {status})")
+            elif status == 404:
+                raise Exception(f"GitHub API endpoint not found (code {status})")
+            else:
+                raise Exception(f"GitHub API HTTP error {status}: {error_body[:100]}")
+        
+        try:
+            result = json.loads(response_body.decode('utf-8'))
+            
+            self._log(f"[GITHUB] ✓ Gist created: {result.get('html_url', 'unknown')}")
+            
+            # BUG#009 DEBUG: Log what hash was stored in the gist
+            if proof_dict:
+                stored_hash = gist_content.get('proof_details', {}).get('file_hash', 'MISSING')
+                self._log(f"[GITHUB-DEBUG] File hash stored in gist: {stored_hash[:40] if stored_hash != 'MISSING' else 'MISSING'}...")
+                self._log(f"[GITHUB-DEBUG] Classification: {gist_content.get('proof_details', {}).get('classification', 'MISSING')}")
+                self._log(f"[GITHUB-DEBUG] Session ID: {gist_content.get('proof_details', {}).get('session_id', 'MISSING')}")
+            
+            return {
+                'url': result['html_url'],
+                'commit_sha': result['history'][0]['version'] if result.get('history') else None,
+                'timestamp': result.get('created_at', gist_content['timestamp']),
+                'verified': True
+            }
         except Exception as e:
             self._log(f"[GITHUB] Unexpected error: {e}")
             self._log(f"[GITHUB] Error type: {type(e).__name__}")
@@ -425,6 +414,270 @@ class TripleTimestampService:
             self._log(f"[GITHUB] Traceback:\n{traceback.format_exc()}")
             raise Exception(f"{type(e).__name__}: {str(e)}")
     
+    def _get_ssl_context(self):
+        """Return the service's SSL context, creating it on first use"""
+        if self._ssl_context is None:
+            self._ssl_context = self._create_ssl_context()
+        return self._ssl_context
+    
+    def _create_ssl_context(self):
+        """
+        Create an SSL context for cross-platform certificate handling.
+        
+        Tries certifi, then the system default, then the Windows cert store,
+        and finally falls back to an unverified context.
+        
+        Returns:
+            ssl.SSLContext
+        """
+        self._log("[GITHUB-SUBMIT] Creating SSL context...")
+        
+        # DIAGNOSTIC: Check for certifi package (Python SSL cert bundle)
+        certifi_available = False
+        certifi_path = None
+        try:
+            import certifi
+            certifi_available = True
+            certifi_path = certifi.where()
+            self._log(f"[SSL-DIAG] certifi package available: {certifi_path}")
+        except ImportError:
+            self._log("[SSL-DIAG] certifi package NOT available")
+        
+        # DIAGNOSTIC: Check system SSL paths
+        import platform
+        system_info = platform.system()
+        self._log(f"[SSL-DIAG] Operating system: {system_info}")
+        
+        system_cert_paths = [
+            '/etc/ssl/cert.pem',  # macOS
+            '/etc/ssl/certs/ca-certificates.crt',  # Linux
+            '/etc/pki/tls/certs/ca-bundle.crt',  # RedHat/CentOS
+        ]
+        
+        # Windows certificate paths (system cert store)
+        if system_info == 'Windows':
+            self._log("[SSL-DIAG] Windows detected - will use system cert store")
+        
+        self._log("[SSL-DIAG] Checking system certificate paths:")
+        for cert_path in system_cert_paths:
+            exists = os.path.isfile(cert_path)
+            self._log(f"[SSL-DIAG]   {cert_path}: {'EXISTS' if exists else 'NOT FOUND'}")
+        
+        # Try multiple SSL context creation strategies
+        ssl_context = None
+        ssl_strategy_used = None
+        
+        # Strategy 1: Use certifi if available (best for Windows)
+        if certifi_available and certifi_path and os.path.isfile(certifi_path):
+            self._log("[SSL-STRATEGY-1] Trying certifi package...")
+            try:
+                ssl_context = ssl.create_default_context(cafile=certifi_path)
+                ssl_strategy_used = "certifi"
+                self._log("[SSL-STRATEGY-1] ✓ SSL context created with certifi")
+            except Exception as e:
+                self._log(f"[SSL-STRATEGY-1] ✗ certifi failed: {e}")
+        
+        # Strategy 2: Use default context (system certs) - works on macOS/Linux
+        if not ssl_context:
+            self._log("[SSL-STRATEGY-2] Trying default system context...")
+            try:
+                ssl_context = ssl.create_default_context()
+                ssl_strategy_used = "system_default"
+                self._log("[SSL-STRATEGY-2] ✓ SSL context created with system certs")
+            except Exception as e:
+                self._log(f"[SSL-STRATEGY-2] ✗ Default context failed: {e}")
+        
+        # Strategy 3: Windows-specific - load system certs manually
+        if not ssl_context and system_info == 'Windows':
+            self._log("[SSL-STRATEGY-3] Trying Windows cert store import...")
+            try:
+                ssl_context = ssl.create_default_context()
+                # On Windows, Python should automatically use the system cert store
+                # But we'll explicitly set minimum TLS version for compatibility
+                ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+                ssl_strategy_used = "windows_certstore"
+                self._log("[SSL-STRATEGY-3] ✓ SSL context with Windows cert store")
+            except Exception as e:
+                self._log(f"[SSL-STRATEGY-3] ✗ Windows cert store failed: {e}")
+        
+        # Strategy 4: Unverified context (FALLBACK - less secure but functional)
+        if not ssl_context:
+            self._log("[SSL-STRATEGY-4] ⚠️  FALLBACK: Using unverified SSL context")
+            self._log("[SSL-STRATEGY-4] ⚠️  This disables certificate verification")
+            self._log("[SSL-STRATEGY-4] ⚠️  Connection is encrypted but not authenticated")
+            ssl_context = ssl._create_unverified_context()
+            ssl_strategy_used = "unverified"
+            self._log("[SSL-STRATEGY-4] ✓ Unverified SSL context created")
+        
+        self._log(f"[GITHUB-SUBMIT] ✓ SSL context created successfully (strategy: {ssl_strategy_used})")
+        return ssl_context
+    
+    def _github_request(self, method, path, body=None, headers=None, timeout=10):
+        """
+        Send a request to the GitHub API over a persistent HTTPS connection.
+        
+        The connection is kept alive between calls. An idle connection GitHub has
+        already closed is detected and reopened before sending. If a reused
+        connection turns out to have been closed by the server while the request
+        is being sent, it is reopened and the request is sent once more.
+        Proxy settings from the environment are honoured through a CONNECT
+        tunnel (see http_util.open_connection). Failures after the request
+        went out (e.g. while reading the response) are never retried, since a
+        gist POST may already have been processed.
+        
+        Args:
+            method: str - HTTP method
+            path: str - request path (e.g. '/gists')
+            body: bytes - optional request body
+            headers: dict - request headers
+            timeout: float - socket timeout in seconds
+        
+        Returns:
+            tuple: (status code, response body bytes, response headers)
+        """
+        while True:
+            if self._github_conn is not None and self._github_connection_dropped():
+                self._log("[GITHUB] Idle connection was closed by the server, reconnecting...")
+                self._close_github_connection()
+            
+            reused = self._github_conn is not None
+            if not reused:
+                # HTTPS, so a configured proxy is tunnelled and no path
+                # prefix or per-request proxy headers are needed
+                self._github_conn, _, _ = open_connection(
+                    'https', GITHUB_API_HOST, timeout=timeout, context=self._get_ssl_context()
+                )
+            try:
+                self._github_conn.request(method, path, body=body, headers=headers or {})
+            except (ConnectionResetError, BrokenPipeError):
+                self._close_github_connection()
+                if not reused:
+                    raise
+                self._log("[GITHUB] Kept-alive connection was closed, reconnecting...")
+                continue
+            except Exception:
+                self._close_github_connection()
+                raise
+            
+            try:
+                response = self._github_conn.getresponse()
+                return response.status, response.read(), response.headers
+            except Exception:
+                self._close_github_connection()
+                raise
+    
+    def _github_connection_dropped(self):
+        """
+        Check whether the idle kept-alive GitHub connection was closed by the server.
+        
+        An idle socket should have nothing to read; if it polls readable, the
+        server has sent EOF (or unexpected data) and the socket can't be reused.
+        """
+        sock = self._github_conn.sock
+        if sock is None:
+            # Closed after a 'Connection: close' response; http.client
+            # reopens it by itself on the next request
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+    
+    def _close_github_connection(self):
+        """Close the persistent GitHub connection (reopened on next request)"""
+        if self._github_conn is not None:
+            self._github_conn.close()
+            self._github_conn = None
+    
+    def fetch_gist_file_hash(self, gist_id):
+        """
+        Fetch the file hash recorded in a proof gist.
+        
+        Uses conditional requests: the gist's ETag is cached on disk
+        (gist_cache.json in the CHM data dir) and sent as If-None-Match, so
+        repeat lookups of the same gist get a 304 with no body to download.
+        GitHub only exempts such a 304 from the rate limit when the request is
+        authenticated; anonymous 304s still count toward the 60/h IP limit.
+        Requests are also throttled client-side with a token bucket (50/h
+        anonymous, 4500/h with a token).
+        
+        Args:
+            gist_id: str - gist ID (last path segment of the gist URL)
+        
+        Returns:
+            str: file_hash from the gist's proof_details, or None if absent
+        
+        Raises:
+            Exception: on rate-limit budget exhaustion, HTTP errors or bad content
+        """
+        cache = self._load_gist_cache()
+        cached = cache.get(gist_id)
+        
+        headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'CHM-Krita-Plugin/1.0'
+        }
+        if self.github_token:
+            headers['Authorization'] = f'token {self.github_token}'
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        
+        if not self._github_bucket.try_acquire():
+            raise Exception("GitHub request budget exhausted for this hour, try again later")
+        
+        status, response_body, response_headers = self._github_request(
+            'GET', f"/gists/{gist_id}", headers=headers
+        )
+        
+        if status == 304 and cached:
+            if self.github_token:
+                # Authenticated 304s don't count against GitHub's limit
+                self._github_bucket.refund()
+            self._log(f"[GITHUB] Gist {gist_id} unchanged (304), using cached file hash")
+            return cached.get('file_hash')
+        
+        if status != 200:
+            error_body = response_body.decode('utf-8', errors='replace') or 'No error body'
+            self._log(f"[GITHUB] HTTP Error {status} fetching gist {gist_id}: {error_body}")
+            raise Exception(f"GitHub gist fetch failed (code {status})")
+        
+        result = json.loads(response_body.decode('utf-8'))
+        proof_file = result.get('files', {}).get('chm_proof_timestamp.json', {})
+        gist_content = json.loads(proof_file.get('content') or '{}')
+        file_hash = gist_content.get('proof_details', {}).get('file_hash')
+        
+        etag = response_headers.get('ETag')
+        if etag:
+            cache[gist_id] = {
+                'etag': etag,
+                'file_hash': file_hash,
+                'fetched_at': datetime.utcnow().isoformat() + 'Z'
+            }
+            self._save_gist_cache()
+        
+        return file_hash
+    
+    def _load_gist_cache(self):
+        """Load the gist ETag cache from disk (once per service instance)"""
+        if self._gist_cache is None:
+            try:
+                with open(self.gist_cache_file, 'r') as f:
+                    self._gist_cache = json.load(f)
+            except (OSError, ValueError):
+                self._gist_cache = {}
+        return self._gist_cache
+    
+    def _save_gist_cache(self):
+        """Write the gist ETag cache to disk (atomically via rename)"""
+        tmp_file = self.gist_cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(self._gist_cache, f)
+            os.replace(tmp_file, self.gist_cache_file)
+        except OSError as e:
+            self._log(f"[GITHUB] ⚠️ Failed to save gist cache: {e}")
+    
     def _submit_to_wayback(self, proof_hash, proof_dict=None):
         """
         Submit proof hash to Internet Archive Wayback Machine.
@@ -557,7 +810,8 @@ class TripleTimestampService:
         """
         Verify that timestamps are still accessible.
         
-        Uses stdlib urllib (no external dependencies).
+        The GitHub gist is checked through fetch_gist_file_hash(), so it
+        shares the ETag cache and request budget; other URLs use stdlib urllib.
         
         Args:
             timestamps: dict - timestamp results from submit_proof_hash()
@@ -572,10 +826,12 @@ class TripleTimestampService:
         """
         import urllib.request
         import urllib.error
-        import ssl
         
-        # Create SSL context
-        ssl_context = ssl.create_default_context()
+        # Verification always checks certificates (never the unverified fallback
+        # used for submission); the strict context is created once and reused
+        if self._verify_ssl_context is None:
+            self._verify_ssl_context = ssl.create_default_context()
+        ssl_context = self._verify_ssl_context
         
         verification = {
             'github': False,
@@ -583,16 +839,14 @@ class TripleTimestampService:
             'chm_log': False
         }
         
-        # Verify GitHub Gist
+        # Verify GitHub Gist (gist ID is the last segment of its URL)
         if timestamps.get('github'):
             try:
-                req = urllib.request.Request(
-                    timestamps['github']['url'],
-                    method='HEAD'
-                )
-                with urllib.request.urlopen(req, timeout=5, context=ssl_context) as response:
-                    verification['github'] = (response.status == 200)
-            except:
+                gist_id = timestamps['github']['url'].rstrip('/').rsplit('/', 1)[-1]
+                self.fetch_gist_file_hash(gist_id)
+                verification['github'] = True
+            except Exception as e:
+                self._log(f"[GITHUB] Gist verification failed: {e}")
                 verification['github'] = False
         
         # Verify Wayback snapshot
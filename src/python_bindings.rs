@@ -72,6 +72,22 @@
              .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
      }
      
+     /// Record a batch of brush stroke events in one call
+     /// 
+     /// Args:
+     ///     strokes (list): List of (x, y, pressure, brush_name) tuples;
+     ///         brush_name may be None
+     fn record_strokes(
+         &mut self,
+         py: Python<'_>,
+         strokes: Vec<(f64, f64, f64, Option<String>)>,
+     ) -> PyResult<()> {
+         // Arguments are converted with the GIL held; the append loop runs without it
+         let inner = &mut self.inner;
+         py.allow_threads(move || inner.record_strokes(strokes))
+             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+     }
+     
      /// Record a layer added event
      /// 
      /// Args:
@@ -177,6 +193,14 @@
         self.inner.duration_secs()
     }
     
+    /// Get (event_count, duration_secs, last_event_timestamp) in one call
+    /// 
+    /// Returns:
+    ///     tuple: (int, int, int) - timestamp is Unix seconds
+    fn status(&self) -> (usize, i64, i64) {
+        self.inner.status()
+    }
+    
     /// Get drawing time in seconds (excludes AFK periods)
     #[getter]
     fn drawing_time_secs(&self) -> i64 {
@@ -122,6 +122,38 @@ impl CHMSession {
         self.record_event(event)
     }
 
+    /// Record a batch of stroke events
+    ///
+    /// Equivalent to calling `record_stroke` for each `(x, y, pressure, brush_name)`
+    /// tuple, but checks the session state once and shares a single timestamp.
+    pub fn record_strokes(
+        &mut self,
+        strokes: Vec<(f64, f64, f64, Option<String>)>,
+    ) -> Result<()> {
+        self.check_not_finalized()?;
+        if self.events.len() + strokes.len() > self.config.max_events {
+            return Err(CHMError::session(format!(
+                "Event limit reached: {}",
+                self.config.max_events
+            )));
+        }
+
+        let timestamp = Utc::now().timestamp();
+        self.events.reserve(strokes.len());
+
+        for (x, y, pressure, brush_name) in strokes {
+            self.record_event(SessionEvent::Stroke {
+                x,
+                y,
+                pressure,
+                timestamp,
+                brush_name,
+            })?;
+        }
+
+        Ok(())
+    }
+
     /// Record a layer event
     pub fn record_layer_added(&mut self, layer_id: String, layer_type: String) -> Result<()> {
         self.check_not_finalized()?;
@@ -443,6 +475,16 @@ impl CHMSession {
         }
     }
     
+    /// Get a snapshot of (event count, duration in seconds, last event timestamp)
+    /// Lets callers poll all three values with a single call; the last event
+    /// timestamp falls back to the session start time when no events exist.
+    pub fn status(&self) -> (usize, i64, i64) {
+        let last_timestamp = self.events.last()
+            .map(|e| e.timestamp())
+            .unwrap_or(self.start_time.timestamp());
+        (self.events.len(), self.duration_secs(), last_timestamp)
+    }
+    
     /// Get drawing time in seconds (excludes AFK periods)
     /// This represents actual time spent drawing, updated by Python layer.
     pub fn drawing_time_secs(&self) -> i64 {
@@ -538,6 +580,39 @@ mod tests {
         assert_eq!(session.events.len(), 1);
     }
 
+    #[test]
+    fn test_record_strokes() {
+        let mut session = CHMSession::new().unwrap();
+        session
+            .record_strokes(vec![
+                (100.0, 200.0, 0.8, Some("Test Brush".to_string())),
+                (110.0, 210.0, 0.8, None),
+            ])
+            .unwrap();
+        assert_eq!(session.events.len(), 2);
+
+        let mut config = SessionConfig::default();
+        config.max_events = 2;
+        let mut session = CHMSession::with_config(config).unwrap();
+        let result = session.record_strokes(vec![(0.0, 0.0, 1.0, None); 3]);
+        assert!(result.is_err());
+        assert_eq!(session.events.len(), 0);
+    }
+
+    #[test]
+    fn test_status() {
+        let mut session = CHMSession::new().unwrap();
+        let (count, _, last) = session.status();
+        assert_eq!(count, 0);
+        assert_eq!(last, session.start_time.timestamp());
+
+        session.record_stroke(100.0, 200.0, 0.8, None).unwrap();
+        let (count, duration, last) = session.status();
+        assert_eq!(count, 1);
+        assert_eq!(duration, session.duration_secs());
+        assert_eq!(last, session.events[0].timestamp());
+    }
+
     #[test]
     fn test_event_limit() {
         let mut config = SessionConfig::default();